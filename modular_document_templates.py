@@ -5,13 +5,70 @@ Modular Document Templates for Multi-Agent Claude Code
 """
 
 import os
+import re
 import yaml
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # 선택적 의존성
+    orjson = None
+
+# json.dump는 호출마다 인코더를 새로 만들므로 하나를 재사용
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+
+@lru_cache(maxsize=256)
+def _split_field_path(path: str) -> Tuple[str, ...]:
+    """점 표기 필드 경로를 키 튜플로 분해 (템플릿 경로는 고정이므로 캐시)"""
+    return tuple(path.split('.'))
+
+_PREFIXED_ID_PATTERN = re.compile(r'^\^([A-Z]+)-\[0-9\]\{([0-9]+)\}\$$')
+_LOWER_SNAKE_PATTERN = '^[a-z_]+$'
+_LOWER_SNAKE_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz_')
+_API_PATH_PATTERN = '^/api/v[0-9]+/.*$'
+
+def _strip_final_newline(value: str) -> str:
+    """정규식 `$`와 동일하게 마지막 개행 하나는 허용"""
+    return value[:-1] if value.endswith('\n') else value
+
+def _compile_pattern_matcher(pattern: str) -> Callable[[str], bool]:
+    """고정 패턴을 문자열 메서드 기반 검사기로 변환 (그 외는 정규식 사용)"""
+    prefixed = _PREFIXED_ID_PATTERN.match(pattern)
+    if prefixed:
+        head = prefixed.group(1) + '-'
+        total = len(head) + int(prefixed.group(2))
+        
+        def match_prefixed_id(value: str) -> bool:
+            value = _strip_final_newline(value)
+            digits = value[len(head):]
+            return (len(value) == total and value.startswith(head)
+                    and digits.isascii() and digits.isdigit())
+        return match_prefixed_id
+    
+    if pattern == _LOWER_SNAKE_PATTERN:
+        def match_lower_snake(value: str) -> bool:
+            value = _strip_final_newline(value)
+            return bool(value) and _LOWER_SNAKE_CHARS.issuperset(value)
+        return match_lower_snake
+    
+    if pattern == _API_PATH_PATTERN:
+        def match_api_path(value: str) -> bool:
+            value = _strip_final_newline(value)
+            if not value.startswith('/api/v'):
+                return False
+            version, sep, rest = value[6:].partition('/')
+            return (bool(sep) and version.isascii() and version.isdigit()
+                    and '\n' not in rest)
+        return match_api_path
+    
+    compiled = re.compile(pattern)
+    return lambda value: compiled.match(value) is not None
 
 class DocumentModule(Enum):
     """문서 모듈 타입"""
@@ -316,6 +373,12 @@ class ModularDocumentSystem:
             size_estimate="small"
         )
         
+        # 패턴 검사기를 미리 생성하여 검증 시 정규식 해석 비용 제거
+        for template in templates.values():
+            for rules in template.validation_rules.values():
+                if 'pattern' in rules:
+                    rules['_match'] = _compile_pattern_matcher(rules['pattern'])
+        
         return templates
     
     def create_module(self, 
@@ -588,9 +651,9 @@ class ModularDocumentSystem:
         
         return data
     
-    def _set_nested_value(self, data: Dict[str, Any], path: str, value: Any):
+    def _set_nested_value(self, data: Dict[str, Any], path: str, value: Any) -> None:
         """중첩된 딕셔너리에 값 설정"""
-        keys = path.split('.')
+        keys = _split_field_path(path)
         current = data
         
         for key in keys[:-1]:
@@ -616,7 +679,7 @@ class ModularDocumentSystem:
     
     def _validate_module_data(self, template: DocumentModuleTemplate, data: Dict[str, Any]) -> Dict[str, Any]:
         """모듈 데이터 유효성 검사"""
-        errors = []
+        errors: List[str] = []
         
         # 필수 필드 검사
         for field_path in template.required_fields:
@@ -629,8 +692,8 @@ class ModularDocumentSystem:
             if value is not None:
                 # 패턴 검사
                 if 'pattern' in rules:
-                    import re
-                    if not re.match(rules['pattern'], str(value)):
+                    matcher = rules.get('_match') or _compile_pattern_matcher(rules['pattern'])
+                    if not matcher(str(value)):
                         errors.append(f"Pattern validation failed for {field_path}: {value}")
                 
                 # 열거형 검사
@@ -653,10 +716,9 @@ class ModularDocumentSystem:
     
     def _get_nested_value(self, data: Dict[str, Any], path: str) -> Any:
         """중첩된 값 조회"""
-        keys = path.split('.')
-        current = data
+        current: Any = data
         
-        for key in keys:
+        for key in _split_field_path(path):
             current = current[key]
         
         return current
@@ -671,8 +733,18 @@ class ModularDocumentSystem:
         module_id = module_doc['metadata']['module_id']
         module_file = self.modules_dir / f"{module_id}.json"
         
-        with open(module_file, 'w', encoding='utf-8') as f:
-            json.dump(module_doc, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            with open(module_file, 'wb') as f:
+                # stdlib 경로(default=str)와 같은 결과가 나오도록 비문자열 키 허용 및 datetime/dataclass는 str()로 위임
+                f.write(orjson.dumps(
+                    module_doc,
+                    default=str,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS),
+                ))
+        else:
+            with open(module_file, 'w', encoding='utf-8') as f:
+                f.write(_JSON_ENCODER.encode(module_doc))
         
         return str(module_file)
     
@@ -7,18 +7,68 @@ Project Dashboard System for Multi-Agent Claude Code
 import os
 import json
 import yaml
+import gzip
+import hashlib
+import heapq
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable, Tuple
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, is_dataclass
+from contextlib import contextmanager
 import threading
 import time
+import queue
 import sqlite3
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, request
 import socketio
 from flask_socketio import SocketIO, emit
 
+try:
+    import orjson
+except ImportError:  # 선택적 의존성
+    orjson = None
+
+def _json_default(obj: Any) -> Any:
+    """표준 json 모듈용 Enum/datetime/데이터클래스 변환"""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps_json(data: Any) -> bytes:
+    """API/SocketIO 응답 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+def _socketio_async_mode() -> str:
+    """SocketIO 비동기 모드 선택
+    
+    eventlet이 표준 라이브러리를 monkey patch한 프로세스(gunicorn -k eventlet 워커는 앱 로드 전에 적용)에서만
+    eventlet을 쓰고, 그 외(개발 서버, 다른 모듈에서 import)에는 threading을 쓴다. patch 없이 eventlet 모드로
+    실행하면 SSE 스트림의 queue.Queue.get 대기와 수집 스레드가 eventlet 허브를 막는다.
+    """
+    try:
+        from eventlet import patcher
+    except ImportError:
+        return 'threading'
+    return 'eventlet' if patcher.is_monkey_patched('thread') else 'threading'
+
+class _SocketIOJSON:
+    """SocketIO 패킷 인코딩에 _dumps_json을 사용하는 json 모듈 대체"""
+    
+    @staticmethod
+    def dumps(obj: Any, *args, **kwargs) -> str:
+        return _dumps_json(obj).decode('utf-8')
+    
+    @staticmethod
+    def loads(s: Union[str, bytes], *args, **kwargs) -> Any:
+        return orjson.loads(s) if orjson is not None else json.loads(s)
+
 class DashboardMetricType(Enum):
     """대시보드 메트릭 타입"""
     PROGRESS = "progress"
@@ -36,7 +86,7 @@ class AlertLevel(Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DashboardMetric:
     """대시보드 메트릭"""
     metric_id: str
@@ -50,7 +100,7 @@ class DashboardMetric:
     role_id: Optional[str]
     project_phase: Optional[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DashboardAlert:
     """대시보드 알림"""
     alert_id: str
@@ -63,7 +113,7 @@ class DashboardAlert:
     action_required: bool
     related_metrics: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoleStatus:
     """역할 상태"""
     role_id: str
@@ -77,6 +127,93 @@ class RoleStatus:
     tasks_pending: int
     average_task_time: float
 
+# 필드 순서를 한 번만 계산해 asdict의 재귀 복사 없이 dict/행 변환에 사용
+_METRIC_FIELDS = tuple(f.name for f in fields(DashboardMetric))
+_ALERT_FIELDS = tuple(f.name for f in fields(DashboardAlert))
+_ROLE_STATUS_FIELDS = tuple(f.name for f in fields(RoleStatus))
+
+def _to_dict(obj: Any, field_names: tuple) -> Dict[str, Any]:
+    """슬롯 데이터클래스를 얕은 dict로 변환"""
+    return {name: getattr(obj, name) for name in field_names}
+
+# 캐시 이름별 dict 변환 필드 (캐시 갱신 시 전송용 dict를 미리 만들어 둠)
+_CACHE_FIELDS = {
+    'metrics_cache': _METRIC_FIELDS,
+    'alerts_cache': _ALERT_FIELDS,
+    'role_status_cache': _ROLE_STATUS_FIELDS,
+}
+
+# 수집 주기마다 새 시각이 찍히는 필드 (이 필드만 다른 항목은 변경으로 보지 않고 기존 항목 유지)
+_CACHE_OBSERVED_AT_FIELDS = {
+    'metrics_cache': 'timestamp',
+    'role_status_cache': 'last_activity',
+}
+
+def _to_epoch_ms(dt: datetime) -> int:
+    """datetime을 epoch 밀리초 정수로 변환 (DB timestamp 컬럼 저장 형식)"""
+    return int(dt.timestamp() * 1000)
+
+def _metric_to_row(metric: DashboardMetric, created_at: str) -> tuple:
+    """dashboard_metrics 행 변환"""
+    return (
+        metric.metric_id, metric.metric_type.value, metric.name,
+        str(metric.value), metric.unit, metric.trend,
+        str(metric.target_value) if metric.target_value else None,
+        _to_epoch_ms(metric.timestamp), metric.role_id, metric.project_phase,
+        created_at
+    )
+
+def _alert_to_row(alert: DashboardAlert, created_at: str) -> tuple:
+    """dashboard_alerts 행 변환"""
+    return (
+        alert.alert_id, alert.level.value, alert.title, alert.message,
+        alert.source, _to_epoch_ms(alert.timestamp), alert.resolved,
+        alert.action_required, _dumps_json(alert.related_metrics).decode('utf-8'),
+        created_at
+    )
+
+def _role_status_to_row(role_status: RoleStatus, updated_at: str) -> tuple:
+    """role_status 행 변환"""
+    return (
+        role_status.role_id, role_status.role_name, role_status.status,
+        role_status.current_task, role_status.progress_percentage,
+        role_status.last_activity.isoformat(), role_status.performance_score,
+        role_status.tasks_completed, role_status.tasks_pending,
+        role_status.average_task_time, updated_at
+    )
+
+# 테이블별 쓰기 SQL (문자열을 한 번만 만들어 sqlite3 문장 캐시가 같은 준비 문장을 재사용)
+_WRITE_SQL = {
+    'dashboard_metrics': '''
+        INSERT INTO dashboard_metrics
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(metric_id) DO UPDATE SET
+            metric_type=excluded.metric_type, name=excluded.name,
+            value=excluded.value, unit=excluded.unit, trend=excluded.trend,
+            target_value=excluded.target_value, timestamp=excluded.timestamp,
+            role_id=excluded.role_id, project_phase=excluded.project_phase,
+            created_at=excluded.created_at
+    ''',
+    'role_status': '''
+        INSERT INTO role_status
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(role_id) DO UPDATE SET
+            role_name=excluded.role_name, status=excluded.status,
+            current_task=excluded.current_task,
+            progress_percentage=excluded.progress_percentage,
+            last_activity=excluded.last_activity,
+            performance_score=excluded.performance_score,
+            tasks_completed=excluded.tasks_completed,
+            tasks_pending=excluded.tasks_pending,
+            average_task_time=excluded.average_task_time,
+            updated_at=excluded.updated_at
+    ''',
+    'dashboard_alerts': '''
+        INSERT OR REPLACE INTO dashboard_alerts
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+}
+
 class ProjectDashboardSystem:
     """프로젝트 대시보드 시스템"""
     
@@ -93,8 +230,16 @@ class ProjectDashboardSystem:
         self.templates_dir.mkdir(exist_ok=True)
         self.static_dir.mkdir(exist_ok=True)
         
-        # 데이터베이스 초기화
+        # 데이터베이스 초기화 (스레드별 연결 재사용, 쓰기는 단일 락으로 직렬화)
         self.db_path = self.data_dir / "dashboard.db"
+        self._tls = threading.local()
+        # 스레드별로 만든 연결 목록 (종료 시 일괄 close)
+        self._connections: List[sqlite3.Connection] = []
+        self._write_lock = threading.RLock()
+        # 테이블별 저장 대기 행 (수집 주기마다 한 트랜잭션으로 flush)
+        self._pending_writes: Dict[str, List[tuple]] = {
+            'dashboard_metrics': [], 'role_status': [], 'dashboard_alerts': []
+        }
         self._init_database()
         
         # Flask 앱 및 SocketIO 설정
@@ -102,18 +247,58 @@ class ProjectDashboardSystem:
                         template_folder=str(self.templates_dir),
                         static_folder=str(self.static_dir))
         self.app.config['SECRET_KEY'] = 'dashboard_secret_key'
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", json=_SocketIOJSON,
+                                 async_mode=_socketio_async_mode())
         
         # 실시간 데이터 수집
         self.metrics_cache: Dict[str, DashboardMetric] = {}
         self.alerts_cache: Dict[str, DashboardAlert] = {}
         self.role_status_cache: Dict[str, RoleStatus] = {}
-        self.cache_lock = threading.Lock()
+        # 캐시 항목의 dict 형태 (갱신 시점에 한 번만 변환, 전송 경로는 재사용)
+        self._payload_cache: Dict[str, Dict[str, Dict[str, Any]]] = {
+            cache_name: {} for cache_name in _CACHE_FIELDS
+        }
+        # 캐시별 갱신 버전 (내용이 바뀔 때만 증가, 전송 시 마지막 전송 이후 변경이 없으면 재구성 생략)
+        self._cache_versions: Dict[str, int] = {cache_name: 0 for cache_name in _CACHE_FIELDS}
+        # 메모리에 보관할 최대 알림 수 (초과 시 오래된 것부터 제거, 이력은 DB에 있음)
+        self.max_cached_alerts = 500
+        # 역할 캐시 집계 (활성 역할 수, 대기 작업 합계) - 갱신 시 증분 반영
+        self._role_totals: Tuple[int, int] = (0, 0)
+        # 캐시는 copy-on-write: 쓰기는 새 dict로 교체하고 읽기는 락 없이 현재 스냅샷 사용
+        # 쓰기 락은 캐시별로 두어 서로 다른 캐시 갱신끼리 경합하지 않도록 함
+        self._cache_locks: Dict[str, threading.Lock] = {
+            cache_name: threading.Lock() for cache_name in _CACHE_FIELDS
+        }
+        
+        # 마지막으로 전송한 대시보드 상태 (변경이 있을 때만 push)
+        self._last_emitted_data: Optional[Dict[str, Any]] = None
+        self._last_emitted_roles: Dict[str, Dict[str, Any]] = {}
+        self._last_emitted_versions: Optional[Tuple[int, ...]] = None
+        
+        # SSE(/api/stream) 구독자별 이벤트 큐
+        self._stream_subscribers: List[queue.Queue] = []
+        self._stream_lock = threading.Lock()
+        
+        # 이력 보존 기간 및 DB 정리 주기 (초)
+        self.retention_days = 7
+        self.prune_interval = 3600
+        self.vacuum_interval = 86400
+        self._last_prune = float('-inf')
+        self._last_vacuum = time.monotonic()
         
         # 데이터 수집 스레드
         self.data_collection_active = True
+        self._wake = threading.Event()
         self.data_thread = threading.Thread(target=self._collect_data_loop, daemon=True)
         
+        # API 응답 본문 캐시 (동시 요청을 짧은 TTL 동안 한 번의 조회·직렬화로 처리)
+        self.response_cache_ttl = 1.0
+        self._response_cache: Dict[Tuple, Tuple[float, bytes]] = {}
+        
+        # 정적 자산 캐시 버전(콘텐츠 해시) 및 gzip 사전 압축본
+        self.asset_versions: Dict[str, str] = {}
+        self._gzip_assets: Dict[str, bytes] = {}
+        
         # 웹 라우트 설정
         self._setup_routes()
         
@@ -123,9 +308,54 @@ class ProjectDashboardSystem:
         
         print("📊 Project Dashboard System 초기화 완료")
     
+    def _connect(self) -> sqlite3.Connection:
+        """PRAGMA가 적용된 데이터베이스 연결 생성"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        # synchronous 등은 연결 단위 설정이므로 연결 생성 시 한 번만 적용
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # 체크포인트 후 WAL 파일을 잘라 장시간 실행 시 파일이 계속 커지지 않도록 제한 (연결마다 적용 필요)
+        conn.execute("PRAGMA journal_size_limit=67108864")
+        with self._write_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def _conn(self) -> sqlite3.Connection:
+        """현재 스레드의 데이터베이스 연결 (최초 호출 시 생성)"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._tls.conn = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (BEGIN/COMMIT, 실패 시 ROLLBACK)"""
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
     def _init_database(self):
         """데이터베이스 초기화"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write_lock:
+            conn = self._conn()
+            # 삭제된 페이지를 주기적으로 회수할 수 있도록 (새 DB 생성 시에만 적용됨)
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL 모드는 DB 파일에 영구 저장되어 수집 스레드와 API 읽기가 동시에 진행 가능
+            conn.execute("PRAGMA journal_mode=WAL")
+        
+        with self._transaction() as conn:
+            # TEXT(ISO-8601) timestamp를 쓰던 기존 테이블은 새 스키마로 옮기기 위해 분리
+            legacy_tables = self._detach_legacy_timestamp_tables(conn)
+            
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS dashboard_metrics (
                     metric_id TEXT PRIMARY KEY,
@@ -135,7 +365,7 @@ class ProjectDashboardSystem:
                     unit TEXT NOT NULL,
                     trend TEXT NOT NULL,
                     target_value TEXT,
-                    timestamp TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     role_id TEXT,
                     project_phase TEXT,
                     created_at TEXT NOT NULL
@@ -149,7 +379,7 @@ class ProjectDashboardSystem:
                     title TEXT NOT NULL,
                     message TEXT NOT NULL,
                     source TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     resolved BOOLEAN DEFAULT FALSE,
                     action_required BOOLEAN DEFAULT FALSE,
                     related_metrics TEXT,
@@ -172,36 +402,97 @@ class ProjectDashboardSystem:
                     updated_at TEXT NOT NULL
                 )
             ''')
+            
+            self._migrate_legacy_timestamp_tables(conn, legacy_tables)
+            
+            # 기간/타입/역할 필터 조회용 인덱스
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_ts ON dashboard_metrics(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_type_ts ON dashboard_metrics(metric_type, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_role_ts ON dashboard_metrics(role_id, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_level_ts ON dashboard_alerts(level, timestamp, resolved)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_ts ON dashboard_alerts(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_role_updated ON role_status(updated_at)")
+    
+    def _detach_legacy_timestamp_tables(self, conn: sqlite3.Connection) -> List[str]:
+        """timestamp가 TEXT인 기존 테이블을 *_legacy로 이름 변경"""
+        legacy_tables = []
+        
+        for table in ('dashboard_metrics', 'dashboard_alerts'):
+            column_types = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if column_types.get('timestamp') == 'TEXT':
+                conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                legacy_tables.append(table)
+        
+        return legacy_tables
+    
+    def _migrate_legacy_timestamp_tables(self, conn: sqlite3.Connection, legacy_tables: List[str]):
+        """기존 행을 epoch-ms timestamp로 변환해 복사하고 legacy 테이블 삭제"""
+        for table in legacy_tables:
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+            # ISO 문자열은 로컬 시각이므로 'utc' 수정자로 UTC 기준 epoch로 변환
+            select_list = ', '.join(
+                "CAST(ROUND((julianday(timestamp, 'utc') - 2440587.5) * 86400000) AS INTEGER)"
+                if column == 'timestamp' else column
+                for column in columns
+            )
+            conn.execute(f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                         f"SELECT {select_list} FROM {table}_legacy")
+            conn.execute(f"DROP TABLE {table}_legacy")
     
     def _setup_routes(self):
         """웹 라우트 설정"""
         
         @self.app.route('/')
         def dashboard():
-            return render_template('dashboard.html')
+            return render_template('dashboard.html', asset_versions=self.asset_versions)
         
         @self.app.route('/api/overview')
         def get_overview():
-            return jsonify(self._get_project_overview())
+            return self._cached_json_response(('overview',), self._get_project_overview)
         
         @self.app.route('/api/metrics')
         def get_metrics():
             metric_type = request.args.get('type')
-            return jsonify(self._get_metrics(metric_type))
+            return self._cached_json_response(('metrics', metric_type),
+                                              lambda: self._select_metrics(metric_type))
         
         @self.app.route('/api/alerts')
         def get_alerts():
             level = request.args.get('level')
-            return jsonify(self._get_alerts(level))
+            return self._cached_json_response(('alerts', level), lambda: self._select_alerts(level))
         
         @self.app.route('/api/roles')
         def get_roles():
-            return jsonify(self._get_role_statuses())
+            return self._cached_json_response(('roles',),
+                                              lambda: list(self.role_status_cache.values()))
         
         @self.app.route('/api/timeline')
         def get_timeline():
             days = int(request.args.get('days', 7))
-            return jsonify(self._get_timeline_data(days))
+            return self._cached_json_response(('timeline', days),
+                                              lambda: self._get_timeline_data(days))
+        
+        @self.app.route('/api/stream')
+        def stream():
+            return Response(self._stream_events(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        
+        @self.app.after_request
+        def add_static_cache_headers(response):
+            # 정적 자산은 URL에 콘텐츠 해시가 붙으므로 장기 캐시 + gzip 전송
+            if request.path.startswith('/static/') and response.status_code == 200:
+                filename = request.path[len('/static/'):]
+                response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+                response.headers['Vary'] = 'Accept-Encoding'
+                
+                compressed = self._gzip_assets.get(filename)
+                if compressed is not None and 'gzip' in request.headers.get('Accept-Encoding', ''):
+                    response.direct_passthrough = False
+                    response.set_data(compressed)
+                    response.headers['Content-Encoding'] = 'gzip'
+                    response.headers.pop('Accept-Ranges', None)
+                    response.set_etag(f"{self.asset_versions[filename]}-gzip")
+            return response
         
         @self.socketio.on('connect')
         def handle_connect():
@@ -214,7 +505,57 @@ class ProjectDashboardSystem:
         
         @self.socketio.on('request_update')
         def handle_update_request():
-            self._emit_real_time_data()
+            self._emit_real_time_data(force=True)
+    
+    def _stream_events(self):
+        """SSE 이벤트 스트림 (연결 유지를 위해 주기적으로 주석 라인 전송)
+        
+        queue.Queue.get으로 대기하므로 스레드 서버(개발 서버, threading 모드)나 monkey patch된
+        eventlet 워커(gunicorn -k eventlet)에서 실행해야 한다 - _socketio_async_mode 참고.
+        """
+        subscriber: queue.Queue = queue.Queue(maxsize=100)
+        with self._stream_lock:
+            self._stream_subscribers.append(subscriber)
+        
+        try:
+            # 첫 청크를 바로 보내 응답 헤더가 즉시 전송되도록 함
+            yield b"retry: 3000\n\n"
+            while True:
+                try:
+                    yield subscriber.get(timeout=15)
+                except queue.Empty:
+                    yield b": keep-alive\n\n"
+        finally:
+            with self._stream_lock:
+                self._stream_subscribers.remove(subscriber)
+    
+    def _broadcast(self, event: str, data: Any):
+        """SocketIO 및 SSE 구독자에게 이벤트 전송"""
+        self.socketio.emit(event, data)
+        
+        with self._stream_lock:
+            subscribers = list(self._stream_subscribers)
+        if not subscribers:
+            return
+        
+        # 한 번 직렬화한 바이트를 모든 구독자가 공유 (구독자별 재인코딩 없음)
+        message = b"event: " + event.encode('ascii') + b"\ndata: " + _dumps_json(data) + b"\n\n"
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                pass  # 읽지 못하는 느린 클라이언트는 건너뜀
+    
+    def _cached_json_response(self, key: Tuple, producer: Callable[[], Any]) -> Response:
+        """TTL 동안 직렬화된 응답 본문 재사용 (수집 주기마다 무효화)"""
+        now = time.monotonic()
+        cached = self._response_cache.get(key)
+        
+        if cached is None or cached[0] <= now:
+            cached = (now + self.response_cache_ttl, _dumps_json(producer()))
+            self._response_cache[key] = cached
+        
+        return Response(cached[1], mimetype='application/json')
     
     def _create_dashboard_templates(self):
         """대시보드 템플릿 파일 생성"""
@@ -228,9 +569,8 @@ class ProjectDashboardSystem:
     <title>Multi-Agent Project Dashboard</title>
     <link href="https://cdnjs.cloudflare.com/ajax/libs/tailwindcss/2.2.19/tailwind.min.css" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.0/socket.io.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.9.1/chart.min.js"></script>
-    <link rel="stylesheet" href="{{ url_for('static', filename='dashboard.css') }}">
+    <link rel="stylesheet" href="{{ url_for('static', filename='dashboard.css', v=asset_versions['dashboard.css']) }}">
 </head>
 <body class="bg-gray-50 min-h-screen">
     <!-- 헤더 -->
@@ -326,7 +666,7 @@ class ProjectDashboardSystem:
                         </h2>
                     </div>
                     <div class="p-6">
-                        <div id="alerts-container" class="space-y-3 max-h-96 overflow-y-auto">
+                        <div id="alerts-container" class="max-h-96 overflow-y-auto">
                             <!-- 알림들이 여기에 동적으로 추가됩니다 -->
                         </div>
                     </div>
@@ -367,19 +707,20 @@ class ProjectDashboardSystem:
                 </h2>
             </div>
             <div class="p-6">
-                <div id="timeline-container" class="timeline">
-                    <!-- 타임라인 이벤트들이 여기에 동적으로 추가됩니다 -->
+                <div id="timeline-scroll" class="max-h-96 overflow-y-auto">
+                    <div id="timeline-container" class="timeline">
+                        <!-- 타임라인 이벤트들이 여기에 동적으로 추가됩니다 -->
+                    </div>
                 </div>
             </div>
         </div>
     </main>
 
-    <script src="{{ url_for('static', filename='dashboard.js') }}"></script>
+    <script src="{{ url_for('static', filename='dashboard.js', v=asset_versions['dashboard.js']) }}"></script>
 </body>
 </html>'''
         
-        with open(self.templates_dir / 'dashboard.html', 'w', encoding='utf-8') as f:
-            f.write(dashboard_html)
+        self._write_if_changed(self.templates_dir / 'dashboard.html', dashboard_html.encode('utf-8'))
     
     def _create_dashboard_assets(self):
         """대시보드 CSS/JS 파일 생성"""
@@ -462,41 +803,93 @@ class ProjectDashboardSystem:
 }
 '''
         
-        with open(self.static_dir / 'dashboard.css', 'w', encoding='utf-8') as f:
-            f.write(dashboard_css)
+        self._write_static_asset('dashboard.css', dashboard_css)
         
         # JavaScript 파일
         dashboard_js = '''
+class VirtualList {
+    // 보이는 구간의 행만 DOM에 마운트하고 위/아래 여백으로 스크롤 높이를 유지
+    constructor(scrollContainer, listContainer, renderItem, rowHeight, buffer = 5) {
+        this.scrollContainer = scrollContainer;
+        this.listContainer = listContainer;
+        this.renderItem = renderItem;
+        this.rowHeight = rowHeight;
+        this.buffer = buffer;
+        this.items = [];
+        this.scrollContainer.addEventListener('scroll', () => this.render(), { passive: true });
+    }
+
+    setItems(items) {
+        this.items = items;
+        this.render();
+    }
+
+    createSpacer(height) {
+        const spacer = document.createElement('div');
+        spacer.style.height = `${height}px`;
+        return spacer;
+    }
+
+    render() {
+        const viewHeight = this.scrollContainer.clientHeight || 384;
+        const first = Math.floor(this.scrollContainer.scrollTop / this.rowHeight);
+        const start = Math.max(0, first - this.buffer);
+        const end = Math.min(this.items.length, first + Math.ceil(viewHeight / this.rowHeight) + this.buffer);
+
+        const fragment = document.createDocumentFragment();
+        fragment.appendChild(this.createSpacer(start * this.rowHeight));
+        for (let i = start; i < end; i++) {
+            const row = document.createElement('div');
+            row.style.height = `${this.rowHeight}px`;
+            row.style.overflow = 'hidden';
+            row.appendChild(this.renderItem(this.items[i]));
+            fragment.appendChild(row);
+        }
+        fragment.appendChild(this.createSpacer((this.items.length - end) * this.rowHeight));
+
+        this.listContainer.replaceChildren(fragment);
+    }
+}
+
 class DashboardManager {
     constructor() {
-        this.socket = io();
+        this.stream = new EventSource('/api/stream');
         this.charts = {};
-        this.initializeSocketListeners();
+
+        const alertsContainer = document.getElementById('alerts-container');
+        this.alertList = new VirtualList(alertsContainer, alertsContainer,
+            alert => this.createAlertElement(alert), 96);
+        this.timelineList = new VirtualList(document.getElementById('timeline-scroll'),
+            document.getElementById('timeline-container'),
+            event => this.createTimelineItem(event), 128);
+
+        this.initializeStreamListeners();
         this.initializeCharts();
         this.loadInitialData();
     }
 
-    initializeSocketListeners() {
-        this.socket.on('connect', () => {
+    initializeStreamListeners() {
+        // 서버 → 클라이언트 단방향 스트림 (EventSource가 자동 재연결)
+        this.stream.onopen = () => {
             console.log('서버에 연결됨');
             this.updateConnectionStatus(true);
-        });
+        };
 
-        this.socket.on('disconnect', () => {
+        this.stream.onerror = () => {
             console.log('서버 연결 해제됨');
             this.updateConnectionStatus(false);
-        });
+        };
 
-        this.socket.on('dashboard_update', (data) => {
-            this.updateDashboard(data);
+        this.stream.addEventListener('dashboard_update', (e) => {
+            this.updateDashboard(JSON.parse(e.data));
         });
 
-        this.socket.on('new_alert', (alert) => {
-            this.addAlert(alert);
+        this.stream.addEventListener('new_alert', (e) => {
+            this.addAlert(JSON.parse(e.data));
         });
 
-        this.socket.on('role_update', (roleData) => {
-            this.updateRoleStatus(roleData);
+        this.stream.addEventListener('role_update', (e) => {
+            this.updateRoleStatus(JSON.parse(e.data));
         });
     }
 
@@ -602,6 +995,7 @@ class DashboardManager {
     createRoleCard(role) {
         const card = document.createElement('div');
         card.className = 'role-card bg-gray-50 rounded-lg p-4 border';
+        card.dataset.roleId = role.role_id;
         
         card.innerHTML = `
             <div class="flex items-center justify-between mb-3">
@@ -614,7 +1008,7 @@ class DashboardManager {
                         <p class="text-sm text-gray-600">${role.role_id}</p>
                     </div>
                 </div>
-                <span class="px-3 py-1 rounded-full text-xs font-medium status-${role.status}">
+                <span class="role-status px-3 py-1 rounded-full text-xs font-medium status-${role.status}">
                     ${this.getStatusText(role.status)}
                 </span>
             </div>
@@ -622,7 +1016,7 @@ class DashboardManager {
             <div class="mb-3">
                 <div class="flex justify-between text-sm text-gray-600 mb-1">
                     <span>진행률</span>
-                    <span>${role.progress_percentage}%</span>
+                    <span class="role-progress">${role.progress_percentage}%</span>
                 </div>
                 <div class="progress-bar">
                     <div class="progress-fill" style="width: ${role.progress_percentage}%"></div>
@@ -630,9 +1024,9 @@ class DashboardManager {
             </div>
             
             <div class="text-sm text-gray-600">
-                <p><strong>현재 작업:</strong> ${role.current_task || '없음'}</p>
-                <p><strong>완료:</strong> ${role.tasks_completed}개 | <strong>대기:</strong> ${role.tasks_pending}개</p>
-                <p><strong>성능 점수:</strong> ${role.performance_score.toFixed(2)}</p>
+                <p><strong>현재 작업:</strong> <span class="role-current-task">${role.current_task || '없음'}</span></p>
+                <p><strong>완료:</strong> <span class="role-tasks-completed">${role.tasks_completed}</span>개 | <strong>대기:</strong> <span class="role-tasks-pending">${role.tasks_pending}</span>개</p>
+                <p><strong>성능 점수:</strong> <span class="role-performance">${role.performance_score.toFixed(2)}</span></p>
             </div>
         `;
         
@@ -650,18 +1044,14 @@ class DashboardManager {
     }
 
     updateAlerts(alerts) {
-        const container = document.getElementById('alerts-container');
-        container.innerHTML = '';
-
         if (alerts.length === 0) {
-            container.innerHTML = '<p class="text-gray-500 text-center">새로운 알림이 없습니다.</p>';
+            this.alertList.items = [];
+            document.getElementById('alerts-container').innerHTML =
+                '<p class="text-gray-500 text-center">새로운 알림이 없습니다.</p>';
             return;
         }
 
-        alerts.forEach(alert => {
-            const alertElement = this.createAlertElement(alert);
-            container.appendChild(alertElement);
-        });
+        this.alertList.setItems(alerts);
     }
 
     createAlertElement(alert) {
@@ -693,13 +1083,7 @@ class DashboardManager {
     }
 
     updateTimeline(timelineData) {
-        const container = document.getElementById('timeline-container');
-        container.innerHTML = '';
-
-        timelineData.forEach(event => {
-            const timelineItem = this.createTimelineItem(event);
-            container.appendChild(timelineItem);
-        });
+        this.timelineList.setItems(timelineData);
     }
 
     createTimelineItem(event) {
@@ -736,70 +1120,156 @@ class DashboardManager {
 
     addAlert(alert) {
         // 새 알림을 맨 위에 추가
-        const container = document.getElementById('alerts-container');
-        const alertElement = this.createAlertElement(alert);
-        container.insertBefore(alertElement, container.firstChild);
+        this.alertList.setItems([alert, ...this.alertList.items]);
         
         // 알림 수 업데이트
         const alertCount = document.getElementById('alert-count');
         alertCount.textContent = parseInt(alertCount.textContent) + 1;
     }
 
-    updateRoleStatus(roleData) {
-        // 특정 역할의 상태만 업데이트
-        this.loadInitialData(); // 간단한 구현으로 전체 새로고침
+    updateRoleStatus(roles) {
+        // 변경된 역할 카드만 제자리에서 갱신
+        const container = document.getElementById('roles-container');
+
+        roles.forEach(role => {
+            const card = container.querySelector(`[data-role-id="${role.role_id}"]`);
+            if (!card) {
+                container.appendChild(this.createRoleCard(role));
+                return;
+            }
+
+            const status = card.querySelector('.role-status');
+            status.className = `role-status px-3 py-1 rounded-full text-xs font-medium status-${role.status}`;
+            status.textContent = this.getStatusText(role.status);
+            card.querySelector('.role-progress').textContent = `${role.progress_percentage}%`;
+            card.querySelector('.progress-fill').style.width = `${role.progress_percentage}%`;
+            card.querySelector('.role-current-task').textContent = role.current_task || '없음';
+            card.querySelector('.role-tasks-completed').textContent = role.tasks_completed;
+            card.querySelector('.role-tasks-pending').textContent = role.tasks_pending;
+            card.querySelector('.role-performance').textContent = role.performance_score.toFixed(2);
+        });
     }
 }
 
-// 대시보드 초기화
+// 대시보드 초기화 (갱신은 서버가 변경 시 push)
 document.addEventListener('DOMContentLoaded', () => {
-    new DashboardManager();
+    window.dashboard = new DashboardManager();
 });
-
-// 주기적 업데이트 요청
-setInterval(() => {
-    if (window.dashboard && window.dashboard.socket.connected) {
-        window.dashboard.socket.emit('request_update');
-    }
-}, 30000); // 30초마다
 '''
         
-        with open(self.static_dir / 'dashboard.js', 'w', encoding='utf-8') as f:
-            f.write(dashboard_js)
+        self._write_static_asset('dashboard.js', dashboard_js)
+    
+    def _write_if_changed(self, file_path: Path, data: bytes) -> bool:
+        """내용이 달라졌을 때만 파일 기록 (재시작마다 불필요한 쓰기 방지)"""
+        try:
+            if file_path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            pass
+        
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        return True
     
-    def start_dashboard_server(self, host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
-        """대시보드 서버 시작"""
+    def _write_static_asset(self, filename: str, content: str):
+        """정적 자산 저장 및 캐시 버전/gzip 압축본 준비"""
+        data = content.encode('utf-8')
+        self._write_if_changed(self.static_dir / filename, data)
+        
+        self.asset_versions[filename] = hashlib.blake2b(data, digest_size=8).hexdigest()
+        self._gzip_assets[filename] = gzip.compress(data)
+    
+    def start_dashboard_server(self, host: str = '0.0.0.0', port: int = 5000, debug: bool = False,
+                               production: bool = False):
+        """대시보드 서버 시작
+        
+        production=True이면 개발 서버 대신 gunicorn + eventlet 워커로 프로세스를 교체한다.
+        Flask-SocketIO는 sticky session 없이 워커 1개만 지원하므로 -w 1로 실행하며,
+        eventlet 워커가 앱 로드 전에 monkey patch를 적용한다 (--preload는 patch 전에 앱을 로드하므로 사용 금지).
+        그 외에는 threading 모드의 Werkzeug 개발 서버로 실행한다.
+        """
+        
+        if production:
+            print(f"🌐 대시보드 서버 시작 (gunicorn/eventlet): http://{host}:{port}")
+            os.environ[DASHBOARD_ROOT_ENV] = str(self.project_root)
+            os.execvp('gunicorn', [
+                'gunicorn', '-k', 'eventlet', '-w', '1', '-b', f"{host}:{port}",
+                'project_dashboard_system:create_app()'
+            ])
         
         # 데이터 수집 스레드 시작
         if not self.data_thread.is_alive():
             self.data_thread.start()
         
         print(f"🌐 대시보드 서버 시작: http://{host}:{port}")
-        self.socketio.run(self.app, host=host, port=port, debug=debug)
+        try:
+            self.socketio.run(self.app, host=host, port=port, debug=debug)
+        finally:
+            self.close()
     
     def _collect_data_loop(self):
         """데이터 수집 루프"""
         while self.data_collection_active:
             try:
                 # 프로젝트 상태 수집
-                self._collect_project_metrics()
+                metrics = self._collect_project_metrics()
                 
                 # 역할 상태 수집
-                self._collect_role_statuses()
+                role_statuses = self._collect_role_statuses()
                 
                 # 알림 확인
-                self._check_alerts()
+                alerts = self._check_alerts()
+                
+                # 이번 주기에 수집한 데이터를 한 트랜잭션으로 저장
+                self._save_collected_data(metrics, role_statuses, alerts)
+                
+                # 새 데이터가 반영되도록 API 응답 캐시 무효화
+                self._response_cache = {}
                 
                 # 실시간 데이터 전송
                 self._emit_real_time_data()
                 
-                time.sleep(10)  # 10초마다 수집
+                # 보존 기간이 지난 이력 정리
+                self._run_db_maintenance()
+                
+                self._wait_next_cycle(10)  # 10초마다 수집
                 
             except Exception as e:
                 print(f"데이터 수집 오류: {str(e)}")
-                time.sleep(30)
+                self._wait_next_cycle(30)
+    
+    def _wait_next_cycle(self, timeout: float):
+        """다음 수집 주기까지 대기 (request_collection/중지 시 즉시 깨어남)"""
+        self._wake.wait(timeout=timeout)
+        self._wake.clear()
     
-    def _collect_project_metrics(self):
+    def request_collection(self):
+        """다음 주기를 기다리지 않고 즉시 수집 요청"""
+        self._wake.set()
+    
+    def stop_data_collection(self):
+        """데이터 수집 스레드 중지"""
+        self.data_collection_active = False
+        self._wake.set()
+    
+    def close(self):
+        """수집 중지 후 남은 쓰기를 저장하고 모든 데이터베이스 연결 종료"""
+        self.stop_data_collection()
+        if self.data_thread.is_alive() and self.data_thread is not threading.current_thread():
+            self.data_thread.join(timeout=5)
+        
+        try:
+            self._flush_writes()
+        except Exception as e:
+            print(f"⚠️ 대기 중인 데이터 저장 실패: {e}")
+        
+        with self._write_lock:
+            connections, self._connections = self._connections, []
+            for conn in connections:
+                conn.close()
+            self._tls = threading.local()
+    
+    def _collect_project_metrics(self) -> List[DashboardMetric]:
         """프로젝트 메트릭 수집"""
         try:
             # 다른 시스템들에서 메트릭 수집
@@ -819,16 +1289,15 @@ setInterval(() => {
                 project_phase="development"
             )
             
-            with self.cache_lock:
-                self.metrics_cache[progress_metric.metric_id] = progress_metric
+            self._update_cache('metrics_cache', {progress_metric.metric_id: progress_metric})
             
-            # 데이터베이스에 저장
-            self._save_metric(progress_metric)
+            return [progress_metric]
             
         except Exception as e:
             print(f"프로젝트 메트릭 수집 오류: {str(e)}")
+            return []
     
-    def _collect_role_statuses(self):
+    def _collect_role_statuses(self) -> List[RoleStatus]:
         """역할 상태 수집"""
         try:
             # 예시 역할 상태들
@@ -868,181 +1337,293 @@ setInterval(() => {
                 }
             ]
             
-            with self.cache_lock:
-                for role_data in example_roles:
-                    role_status = RoleStatus(
-                        role_id=role_data["role_id"],
-                        role_name=role_data["role_name"],
-                        status=role_data["status"],
-                        current_task=role_data["current_task"],
-                        progress_percentage=role_data["progress_percentage"],
-                        last_activity=datetime.now(),
-                        performance_score=role_data["performance_score"],
-                        tasks_completed=role_data["tasks_completed"],
-                        tasks_pending=role_data["tasks_pending"],
-                        average_task_time=role_data["average_task_time"]
-                    )
-                    
-                    self.role_status_cache[role_status.role_id] = role_status
-                    self._save_role_status(role_status)
+            now = datetime.now()
+            role_statuses = []
+            for role_data in example_roles:
+                role_status = RoleStatus(
+                    role_id=role_data["role_id"],
+                    role_name=role_data["role_name"],
+                    status=role_data["status"],
+                    current_task=role_data["current_task"],
+                    progress_percentage=role_data["progress_percentage"],
+                    last_activity=now,
+                    performance_score=role_data["performance_score"],
+                    tasks_completed=role_data["tasks_completed"],
+                    tasks_pending=role_data["tasks_pending"],
+                    average_task_time=role_data["average_task_time"]
+                )
+                
+                role_statuses.append(role_status)
+            
+            self._update_cache('role_status_cache', {r.role_id: r for r in role_statuses})
+            
+            return role_statuses
             
         except Exception as e:
             print(f"역할 상태 수집 오류: {str(e)}")
+            return []
     
-    def _check_alerts(self):
+    def _check_alerts(self) -> List[DashboardAlert]:
         """알림 확인"""
         try:
+            new_alerts = []
             # 예시 알림 생성 (실제로는 시스템 상태를 확인)
             if len(self.alerts_cache) < 3:  # 테스트용
+                now = datetime.now()
                 alert = DashboardAlert(
-                    alert_id=f"alert_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    alert_id=f"alert_{now.strftime('%Y%m%d_%H%M%S')}",
                     level=AlertLevel.INFO,
                     title="시스템 정상 작동",
                     message="모든 에이전트가 정상적으로 작동 중입니다.",
                     source="system_monitor",
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     resolved=False,
                     action_required=False,
                     related_metrics=["overall_progress"]
                 )
                 
-                with self.cache_lock:
-                    self.alerts_cache[alert.alert_id] = alert
+                self._update_cache('alerts_cache', {alert.alert_id: alert})
                 
-                self._save_alert(alert)
+                new_alerts.append(alert)
+            
+            return new_alerts
             
         except Exception as e:
             print(f"알림 확인 오류: {str(e)}")
+            return []
     
-    def _emit_real_time_data(self):
-        """실시간 데이터 전송"""
+    def _update_cache(self, cache_name: str, updates: Dict[str, Any]):
+        """캐시 스냅샷을 복사·갱신한 뒤 통째로 교체 (내용이 바뀐 항목이 있을 때만 버전 증가)"""
+        field_names = _CACHE_FIELDS[cache_name]
+        observed_at_field = _CACHE_OBSERVED_AT_FIELDS.get(cache_name)
+        with self._cache_locks[cache_name]:
+            current = getattr(self, cache_name)
+            current_payloads = self._payload_cache[cache_name]
+            
+            # 수집 시각 외에 달라진 것이 없는 항목은 기존 항목을 그대로 둠
+            changed = {}
+            for key, value in updates.items():
+                payload = _to_dict(value, field_names)
+                previous = current_payloads.get(key)
+                if previous is not None and observed_at_field:
+                    previous = {**previous, observed_at_field: payload[observed_at_field]}
+                if payload != previous:
+                    changed[key] = (value, payload)
+            if not changed:
+                return
+            
+            updates = {key: value for key, (value, _) in changed.items()}
+            if cache_name == 'role_status_cache':
+                self._role_totals = self._apply_role_totals(current, updates)
+            
+            snapshot = dict(current)
+            snapshot.update(updates)
+            
+            payloads = dict(current_payloads)
+            payloads.update((key, payload) for key, (_, payload) in changed.items())
+            
+            if cache_name == 'alerts_cache':
+                # dict는 삽입 순서를 유지하므로 앞쪽이 가장 오래된 알림
+                while len(snapshot) > self.max_cached_alerts:
+                    oldest = next(iter(snapshot))
+                    del snapshot[oldest]
+                    payloads.pop(oldest, None)
+            
+            # 전송용 dict를 먼저 교체해 새 객체가 보이는 시점에는 dict도 준비되어 있도록 함
+            self._payload_cache[cache_name] = payloads
+            setattr(self, cache_name, snapshot)
+            self._cache_versions[cache_name] += 1
+    
+    def _apply_role_totals(self, current: Dict[str, RoleStatus],
+                           updates: Dict[str, RoleStatus]) -> Tuple[int, int]:
+        """교체되는 역할의 기존 기여분을 빼고 새 값을 더한 집계"""
+        active_roles, pending_tasks = self._role_totals
+        for role_id, new in updates.items():
+            old = current.get(role_id)
+            if old is not None:
+                active_roles -= old.status == "active"
+                pending_tasks -= old.tasks_pending
+            active_roles += new.status == "active"
+            pending_tasks += new.tasks_pending
+        return active_roles, pending_tasks
+    
+    def _emit_real_time_data(self, force: bool = False):
+        """실시간 데이터 전송 (이전 전송 이후 변경이 있을 때만)"""
         try:
+            # 마지막 전송 이후 어떤 캐시도 갱신되지 않았다면 비교할 필요도 없음
+            versions = tuple(self._cache_versions.values())
+            if not force and versions == self._last_emitted_versions:
+                return
+            self._last_emitted_versions = versions
+            
+            # 역할 상태는 변경된 역할만 델타로 전송
+            roles = self._get_role_statuses()
+            changed_roles = [r for r in roles
+                             if force or r != self._last_emitted_roles.get(r['role_id'])]
+            self._last_emitted_roles = {r['role_id']: r for r in roles}
+            
             dashboard_data = {
                 'overview': self._get_project_overview(),
-                'roles': self._get_role_statuses(),
-                'alerts': self._get_alerts(),
-                'timestamp': datetime.now().isoformat()
+                'alerts': self._get_alerts()
             }
             
-            self.socketio.emit('dashboard_update', dashboard_data)
+            if force or dashboard_data != self._last_emitted_data:
+                self._last_emitted_data = dashboard_data
+                self._broadcast('dashboard_update', {
+                    **dashboard_data,
+                    'timestamp': datetime.now().isoformat()
+                })
+            
+            if changed_roles:
+                self._broadcast('role_update', changed_roles)
             
         except Exception as e:
             print(f"실시간 데이터 전송 오류: {str(e)}")
     
     def _get_project_overview(self) -> Dict[str, Any]:
         """프로젝트 개요 데이터"""
-        with self.cache_lock:
-            active_roles = len([r for r in self.role_status_cache.values() if r.status == "active"])
-            pending_tasks = sum(r.tasks_pending for r in self.role_status_cache.values())
-            overall_progress = self.metrics_cache.get("overall_progress")
-            
-            return {
-                'overall_progress': int(overall_progress.value) if overall_progress else 0,
-                'active_roles': active_roles,
-                'pending_tasks': pending_tasks,
-                'alert_count': len(self.alerts_cache)
-            }
+        active_roles, pending_tasks = self._role_totals
+        overall_progress = self.metrics_cache.get("overall_progress")
+        
+        return {
+            'overall_progress': int(overall_progress.value) if overall_progress else 0,
+            'active_roles': active_roles,
+            'pending_tasks': pending_tasks,
+            'alert_count': len(self.alerts_cache)
+        }
+    
+    def _select_metrics(self, metric_type: str = None) -> List[DashboardMetric]:
+        """메트릭 객체 조회 (API 응답은 객체를 그대로 직렬화)"""
+        metrics = list(self.metrics_cache.values())
+        
+        if metric_type:
+            metrics = [m for m in metrics if m.metric_type.value == metric_type]
+        
+        return metrics
+    
+    def _select_alerts(self, level: str = None) -> List[DashboardAlert]:
+        """알림 객체 조회 (최신 10개)"""
+        alerts = self.alerts_cache.values()
+        
+        if level:
+            alerts = [a for a in alerts if a.level.value == level]
+        
+        # 전체 정렬 없이 최신 10개만 선택 (최신순)
+        return heapq.nlargest(10, alerts, key=lambda x: x.timestamp)
     
     def _get_metrics(self, metric_type: str = None) -> List[Dict[str, Any]]:
         """메트릭 데이터 조회"""
-        with self.cache_lock:
-            metrics = list(self.metrics_cache.values())
-            
-            if metric_type:
-                metrics = [m for m in metrics if m.metric_type.value == metric_type]
-            
-            return [asdict(m) for m in metrics]
+        payloads = self._payload_cache['metrics_cache']
+        return [payloads.get(m.metric_id) or _to_dict(m, _METRIC_FIELDS)
+                for m in self._select_metrics(metric_type)]
     
     def _get_alerts(self, level: str = None) -> List[Dict[str, Any]]:
         """알림 데이터 조회"""
-        with self.cache_lock:
-            alerts = list(self.alerts_cache.values())
-            
-            if level:
-                alerts = [a for a in alerts if a.level.value == level]
-            
-            # 최신순 정렬
-            alerts.sort(key=lambda x: x.timestamp, reverse=True)
-            
-            return [asdict(a) for a in alerts[:10]]  # 최근 10개만
+        payloads = self._payload_cache['alerts_cache']
+        return [payloads.get(a.alert_id) or _to_dict(a, _ALERT_FIELDS)
+                for a in self._select_alerts(level)]
     
     def _get_role_statuses(self) -> List[Dict[str, Any]]:
         """역할 상태 데이터 조회"""
-        with self.cache_lock:
-            return [asdict(r) for r in self.role_status_cache.values()]
+        return list(self._payload_cache['role_status_cache'].values())
     
     def _get_timeline_data(self, days: int = 7) -> List[Dict[str, Any]]:
         """타임라인 데이터 조회"""
         # 예시 타임라인 데이터
+        now = datetime.now()
         timeline_events = [
             {
                 'title': '프로젝트 시작',
                 'description': '멀티 에이전트 시스템 초기화 완료',
-                'timestamp': (datetime.now() - timedelta(days=5)).isoformat(),
+                'timestamp': (now - timedelta(days=5)).isoformat(),
                 'role': 'system'
             },
             {
                 'title': '요구사항 분석 완료',
                 'description': '비즈니스 요구사항 문서 작성 완료',
-                'timestamp': (datetime.now() - timedelta(days=3)).isoformat(),
+                'timestamp': (now - timedelta(days=3)).isoformat(),
                 'role': 'business_analyst'
             },
             {
                 'title': 'UI 설계 시작',
                 'description': '사용자 인터페이스 설계 작업 시작',
-                'timestamp': (datetime.now() - timedelta(days=2)).isoformat(),
+                'timestamp': (now - timedelta(days=2)).isoformat(),
                 'role': 'ui_ux_designer'
             },
             {
                 'title': '백엔드 API 개발',
                 'description': 'REST API 엔드포인트 구현 중',
-                'timestamp': (datetime.now() - timedelta(days=1)).isoformat(),
+                'timestamp': (now - timedelta(days=1)).isoformat(),
                 'role': 'backend_developer'
             }
         ]
         
         return timeline_events
     
-    def _save_metric(self, metric: DashboardMetric):
-        """메트릭 저장"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO dashboard_metrics
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                metric.metric_id, metric.metric_type.value, metric.name,
-                str(metric.value), metric.unit, metric.trend,
-                str(metric.target_value) if metric.target_value else None,
-                metric.timestamp.isoformat(), metric.role_id, metric.project_phase,
-                datetime.now().isoformat()
-            ))
+    def _run_db_maintenance(self):
+        """주기적 이력 정리 및 incremental vacuum"""
+        now = time.monotonic()
+        
+        if now - self._last_prune >= self.prune_interval:
+            self._prune_history()
+            self._last_prune = now
+        
+        if now - self._last_vacuum >= self.vacuum_interval:
+            with self._write_lock:
+                self._conn().execute("PRAGMA incremental_vacuum").fetchall()
+            self._last_vacuum = now
     
-    def _save_alert(self, alert: DashboardAlert):
-        """알림 저장"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO dashboard_alerts
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                alert.alert_id, alert.level.value, alert.title, alert.message,
-                alert.source, alert.timestamp.isoformat(), alert.resolved,
-                alert.action_required, json.dumps(alert.related_metrics),
-                datetime.now().isoformat()
-            ))
+    def _prune_history(self):
+        """보존 기간이 지난 메트릭/알림 삭제"""
+        cutoff = _to_epoch_ms(datetime.now() - timedelta(days=self.retention_days))
+        
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM dashboard_metrics WHERE timestamp < ?", (cutoff,))
+            conn.execute("DELETE FROM dashboard_alerts WHERE timestamp < ?", (cutoff,))
     
-    def _save_role_status(self, role_status: RoleStatus):
-        """역할 상태 저장"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO role_status
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                role_status.role_id, role_status.role_name, role_status.status,
-                role_status.current_task, role_status.progress_percentage,
-                role_status.last_activity.isoformat(), role_status.performance_score,
-                role_status.tasks_completed, role_status.tasks_pending,
-                role_status.average_task_time, datetime.now().isoformat()
-            ))
+    def _save_collected_data(self,
+                             metrics: List[DashboardMetric],
+                             role_statuses: List[RoleStatus],
+                             alerts: List[DashboardAlert]):
+        """한 수집 주기의 메트릭/역할 상태/알림을 대기열에 추가하고 한 번에 저장"""
+        now = datetime.now().isoformat()
+        
+        with self._write_lock:
+            self._pending_writes['dashboard_metrics'].extend(
+                _metric_to_row(metric, now) for metric in metrics)
+            self._pending_writes['role_status'].extend(
+                _role_status_to_row(role_status, now) for role_status in role_statuses)
+            self._pending_writes['dashboard_alerts'].extend(
+                _alert_to_row(alert, now) for alert in alerts)
+        
+        self._flush_writes()
+    
+    def _flush_writes(self):
+        """대기 중인 행을 단일 트랜잭션으로 저장 (실패 시 다음 주기에 재시도)"""
+        with self._write_lock:
+            pending = self._pending_writes
+            if not any(pending.values()):
+                return
+            self._pending_writes = {table: [] for table in pending}
+            
+            try:
+                with self._transaction() as conn:
+                    for table, rows in pending.items():
+                        if rows:
+                            conn.executemany(_WRITE_SQL[table], rows)
+            except Exception:
+                # 저장하지 못한 행은 새로 쌓인 행보다 앞에 되돌려 순서 유지
+                for table, rows in pending.items():
+                    self._pending_writes[table][:0] = rows
+                raise
+
+DASHBOARD_ROOT_ENV = 'DASHBOARD_PROJECT_ROOT'
+
+def create_app(project_root: Optional[str] = None) -> Flask:
+    """WSGI 서버(gunicorn 등)용 앱 팩토리 - 데이터 수집 스레드까지 시작"""
+    dashboard = ProjectDashboardSystem(project_root or os.environ.get(DASHBOARD_ROOT_ENV, '.'))
+    dashboard.data_thread.start()
+    return dashboard.app
 
 def main():
     """테스트 및 데모"""
@@ -6,12 +6,94 @@ Role Bootstrap System
 
 import os
 import sys
+import atexit
+import threading
 import yaml
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    # libyaml 기반 C 구현 (순수 파이썬 파서보다 수 배 빠름)
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # libyaml 없이 설치된 PyYAML
+    from yaml import SafeLoader, SafeDumper
+
+# 파싱된 시스템 설정(YAML)을 내용 해시별 JSON으로 보관하는 캐시 디렉토리
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "role_bootstrap"
+
+def _load_config_yaml(path: Path) -> Any:
+    """YAML 설정 로드 (내용이 같으면 캐시된 JSON을 사용해 YAML 파싱 생략)"""
+    raw = path.read_bytes()
+    cache_file = CONFIG_CACHE_DIR / f"{hashlib.blake2b(raw, digest_size=16).hexdigest()}.json"
+    
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    data = yaml.load(raw, Loader=SafeLoader)
+    
+    try:
+        # JSON으로 그대로 표현되는 설정만 캐시 (날짜·정수 키 등은 매번 YAML로 파싱)
+        encoded = json.dumps(data, ensure_ascii=False)
+        if json.loads(encoded) == data:
+            CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(encoded, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return data
+
+def _load_status_file(status_file: Path) -> Any:
+    """status.yaml 로드 (YAML보다 오래되지 않은 JSON 사본이 있으면 우선 사용)"""
+    json_file = status_file.with_suffix('.json')
+    
+    try:
+        # 다른 도구가 status.yaml만 수정한 경우에는 사본이 더 오래되므로 YAML을 읽음
+        if json_file.stat().st_mtime_ns >= status_file.stat().st_mtime_ns:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    with open(status_file, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+@lru_cache(maxsize=None)
+def _split_status_key(key: str) -> tuple:
+    """update_status 키 경로 분리 (고정된 소수의 키라 결과를 재사용)"""
+    return tuple(key.split('.'))
+
+def _scan_files(root: str) -> tuple:
+    """디렉토리 트리 탐색 - (디렉토리별 mtime, root 기준 상대 파일 경로 목록)"""
+    dir_mtimes = {}
+    files = []
+    prefix_len = len(root) + 1
+    stack = [root]
+    
+    while stack:
+        current = stack.pop()
+        try:
+            dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path[prefix_len:])
+        except OSError:
+            continue
+    
+    return dir_mtimes, files
+
 class RoleBootstrap:
     def __init__(self):
         self.role_dir = Path.cwd()
@@ -19,6 +101,22 @@ class RoleBootstrap:
         self.role_id = self.role_dir.name
         self.system_initialized = False
         
+        # check_inputs 디렉토리 목록 캐시 (디렉토리 mtime이 그대로면 재탐색 생략)
+        self.inputs_cache_file = self.role_dir / ".inputs_cache.json"
+        self._inputs_cache: Optional[Dict[str, Dict]] = None
+        self._inputs_cache_dirty = False
+        
+        # status.yaml 저장 지연 (짧은 시간 안의 여러 update_status를 한 번의 기록으로 합침)
+        self.save_delay = 0.1
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._status_dirty = False
+        atexit.register(self.flush_status)
+        
+        # 이미 읽은 수신 메시지 (파일명 -> mtime, 요약) - 새로 도착한 메시지만 파싱
+        self.messages_cache_file = self.role_dir / ".messages_cache.json"
+        
         # 설정 파일들 로드
         self.load_system_configuration()
         self.load_role_configuration()
@@ -28,16 +126,13 @@ class RoleBootstrap:
         """시스템 전체 설정 로드"""
         try:
             # 역할 정의 로드
-            with open(self.project_root / "roles.yaml", 'r', encoding='utf-8') as f:
-                self.roles_config = yaml.safe_load(f)
+            self.roles_config = _load_config_yaml(self.project_root / "roles.yaml")
             
             # 자동화 룰 로드
-            with open(self.project_root / "automation_rules.yaml", 'r', encoding='utf-8') as f:
-                self.automation_rules = yaml.safe_load(f)
+            self.automation_rules = _load_config_yaml(self.project_root / "automation_rules.yaml")
             
             # 프로젝트 설정 로드
-            with open(self.project_root / "project_config.yaml", 'r', encoding='utf-8') as f:
-                self.project_config = yaml.safe_load(f)
+            self.project_config = _load_config_yaml(self.project_root / "project_config.yaml")
             
             self.system_initialized = True
             
@@ -69,8 +164,7 @@ class RoleBootstrap:
         
         if status_file.exists():
             try:
-                with open(status_file, 'r', encoding='utf-8') as f:
-                    self.current_status = yaml.safe_load(f)
+                self.current_status = _load_status_file(status_file)
                     
                 # 상태 검증
                 self.validate_status_structure()
@@ -83,13 +177,14 @@ class RoleBootstrap:
     
     def initialize_default_status(self):
         """기본 상태 초기화"""
+        now_iso = datetime.now().isoformat()
         self.current_status = {
             'role_info': {
                 'role_name': self.role_name,
                 'role_id': self.role_id,
                 'assigned_to': f"claude-{self.role_id}",
-                'start_date': datetime.now().isoformat(),
-                'last_updated': datetime.now().isoformat()
+                'start_date': now_iso,
+                'last_updated': now_iso
             },
             'current_status': {
                 'phase': 'planning',
@@ -126,7 +221,7 @@ class RoleBootstrap:
                 'pending_delivery': []
             },
             'communication': {
-                'last_sync': datetime.now().isoformat(),
+                'last_sync': now_iso,
                 'pending_questions': [],
                 'decisions_needed': [],
                 'escalations': []
@@ -166,26 +261,17 @@ class RoleBootstrap:
         missing_deps = []
         ready_deps = []
         
-        for dep_role in self.dependencies:
-            dep_status_file = self.project_root / "roles" / dep_role / "status.yaml"
-            
-            if not dep_status_file.exists():
-                missing_deps.append(dep_role)
-                continue
-            
-            try:
-                with open(dep_status_file, 'r', encoding='utf-8') as f:
-                    dep_status = yaml.safe_load(f)
-                
-                dep_phase = dep_status.get('current_status', {}).get('phase', 'planning')
-                
-                if dep_phase in ['completed', 'review']:
-                    ready_deps.append(dep_role)
-                else:
-                    missing_deps.append(dep_role)
-                    
-            except Exception as e:
-                print(f"⚠️  의존성 확인 오류 ({dep_role}): {str(e)}")
+        # 의존성이 많으면 상태 파일 읽기/파싱을 스레드 풀에서 겹쳐 수행
+        if len(self.dependencies) > 2:
+            with ThreadPoolExecutor(max_workers=min(8, len(self.dependencies))) as pool:
+                dep_ready = list(pool.map(self._is_dependency_ready, self.dependencies))
+        else:
+            dep_ready = [self._is_dependency_ready(dep_role) for dep_role in self.dependencies]
+        
+        for dep_role, ready in zip(self.dependencies, dep_ready):
+            if ready:
+                ready_deps.append(dep_role)
+            else:
                 missing_deps.append(dep_role)
         
         # 의존성 상태 업데이트
@@ -200,6 +286,24 @@ class RoleBootstrap:
         
         return len(missing_deps) == 0
     
+    def _is_dependency_ready(self, dep_role: str) -> bool:
+        """의존 역할의 상태 파일을 읽어 완료(검토) 단계인지 확인"""
+        dep_status_file = self.project_root / "roles" / dep_role / "status.yaml"
+        
+        if not dep_status_file.exists():
+            return False
+        
+        try:
+            dep_status = _load_status_file(dep_status_file)
+            
+            dep_phase = dep_status.get('current_status', {}).get('phase', 'planning')
+            
+            return dep_phase in ['completed', 'review']
+            
+        except Exception as e:
+            print(f"⚠️  의존성 확인 오류 ({dep_role}): {str(e)}")
+            return False
+    
     def check_inputs(self) -> List[str]:
         """필요한 입력 확인"""
         available_inputs = []
@@ -207,41 +311,106 @@ class RoleBootstrap:
         # 공유 디렉토리에서 입력 확인
         shared_dir = self.project_root / "shared"
         if shared_dir.exists():
-            for input_file in shared_dir.rglob("*"):
-                if input_file.is_file():
-                    available_inputs.append(str(input_file.relative_to(shared_dir)))
+            available_inputs.extend(self._list_files(shared_dir))
         
         # 의존성 역할들의 산출물 확인
         for dep_role in self.dependencies:
             dep_deliverables_dir = self.project_root / "roles" / dep_role / "deliverables"
             if dep_deliverables_dir.exists():
-                for deliverable in dep_deliverables_dir.rglob("*"):
-                    if deliverable.is_file():
-                        available_inputs.append(f"{dep_role}:{deliverable.name}")
+                for deliverable in self._list_files(dep_deliverables_dir):
+                    available_inputs.append(f"{dep_role}:{os.path.basename(deliverable)}")
+        
+        self._save_inputs_cache()
         
         return available_inputs
     
+    def _list_files(self, root: Path) -> List[str]:
+        """디렉토리 하위 파일 목록 (모든 하위 디렉토리의 mtime이 그대로면 캐시 사용)"""
+        if self._inputs_cache is None:
+            try:
+                with open(self.inputs_cache_file, 'r', encoding='utf-8') as f:
+                    self._inputs_cache = json.load(f)
+            except (OSError, ValueError):
+                self._inputs_cache = {}
+        
+        key = str(root)
+        cached = self._inputs_cache.get(key)
+        if cached is not None:
+            try:
+                # 파일 추가/삭제/이름 변경은 해당 디렉토리의 mtime을 바꿈
+                if all(os.stat(path).st_mtime_ns == mtime for path, mtime in cached['dirs'].items()):
+                    return cached['files']
+            except OSError:
+                pass
+        
+        dir_mtimes, files = _scan_files(key)
+        self._inputs_cache[key] = {'dirs': dir_mtimes, 'files': files}
+        self._inputs_cache_dirty = True
+        return files
+    
+    def _save_inputs_cache(self):
+        """변경된 디렉토리 목록 캐시 저장"""
+        if not self._inputs_cache_dirty:
+            return
+        
+        try:
+            with open(self.inputs_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._inputs_cache, f, ensure_ascii=False)
+            self._inputs_cache_dirty = False
+        except Exception as e:
+            print(f"⚠️  입력 목록 캐시 저장 실패: {str(e)}")
+    
     def check_communications(self) -> List[Dict]:
         """통신 메시지 확인"""
         messages = []
         comm_dir = self.project_root / "communication" / f"to_{self.role_id}"
         
         if comm_dir.exists():
-            for msg_file in comm_dir.glob("*.yaml"):
-                try:
-                    with open(msg_file, 'r', encoding='utf-8') as f:
-                        message = yaml.safe_load(f)
+            try:
+                with open(self.messages_cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            
+            seen = {}
+            with os.scandir(comm_dir) as entries:
+                for msg_file in entries:
+                    if not msg_file.name.endswith('.yaml') or not msg_file.is_file():
+                        continue
                     
-                    messages.append({
-                        'file': msg_file.name,
-                        'from': message.get('from_role', 'unknown'),
-                        'type': message.get('type', 'unknown'),
-                        'timestamp': message.get('timestamp', 'unknown'),
-                        'content': message.get('content', {})
-                    })
+                    try:
+                        mtime = msg_file.stat().st_mtime_ns
+                        cached = cache.get(msg_file.name)
+                        if cached is not None and cached['mtime'] == mtime:
+                            messages.append(cached['message'])
+                            seen[msg_file.name] = cached
+                            continue
+                        
+                        with open(msg_file, 'r', encoding='utf-8') as f:
+                            message = yaml.load(f, Loader=SafeLoader)
+                        
+                        summary = {
+                            'file': msg_file.name,
+                            'from': message.get('from_role', 'unknown'),
+                            'type': message.get('type', 'unknown'),
+                            'timestamp': message.get('timestamp', 'unknown'),
+                            'content': message.get('content', {})
+                        }
+                        messages.append(summary)
+                        
+                        # JSON으로 그대로 표현되는 메시지만 캐시 (그 외는 매번 YAML로 파싱)
+                        if json.loads(json.dumps(summary, default=str)) == summary:
+                            seen[msg_file.name] = {'mtime': mtime, 'message': summary}
                     
+                    except Exception as e:
+                        print(f"⚠️  메시지 로드 오류 ({msg_file.path}): {str(e)}")
+            
+            if seen != cache:
+                try:
+                    with open(self.messages_cache_file, 'w', encoding='utf-8') as f:
+                        json.dump(seen, f, ensure_ascii=False)
                 except Exception as e:
-                    print(f"⚠️  메시지 로드 오류 ({msg_file}): {str(e)}")
+                    print(f"⚠️  메시지 캐시 저장 실패: {str(e)}")
         
         return messages
     
@@ -250,20 +419,22 @@ class RoleBootstrap:
         comm_dir = self.project_root / "communication" / f"from_{self.role_id}"
         comm_dir.mkdir(parents=True, exist_ok=True)
         
+        # 메시지 시각과 파일명이 같은 시점을 가리키도록 한 번만 조회
+        now = datetime.now()
         message = {
             'from_role': self.role_id,
             'to_role': to_role,
             'type': msg_type,
             'priority': priority,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'content': content
         }
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         msg_file = comm_dir / f"{timestamp}_{msg_type}_{to_role}.yaml"
         
         with open(msg_file, 'w', encoding='utf-8') as f:
-            yaml.dump(message, f, default_flow_style=False)
+            yaml.dump(message, f, Dumper=SafeDumper, default_flow_style=False)
         
         print(f"📨 메시지 전송: {to_role} <- {msg_type}")
     
@@ -274,19 +445,14 @@ class RoleBootstrap:
     def update_status(self, **kwargs):
         """상태 업데이트"""
         for key, value in kwargs.items():
-            if '.' in key:
-                # 중첩된 키 처리 (예: "current_status.progress_percentage")
-                parts = key.split('.')
-                current = self.current_status
-                
-                for part in parts[:-1]:
-                    if part not in current:
-                        current[part] = {}
-                    current = current[part]
-                
-                current[parts[-1]] = value
-            else:
-                self.current_status[key] = value
+            # 중첩된 키 처리 (예: "current_status.progress_percentage")
+            *parents, leaf = _split_status_key(key)
+            current = self.current_status
+            
+            for part in parents:
+                current = current.setdefault(part, {})
+            
+            current[leaf] = value
         
         # 마지막 업데이트 시간 갱신
         self.current_status['role_info']['last_updated'] = datetime.now().isoformat()
@@ -295,14 +461,49 @@ class RoleBootstrap:
         self.save_status()
     
     def save_status(self):
-        """상태 저장"""
-        status_file = self.role_dir / "status.yaml"
-        
-        try:
-            with open(status_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.current_status, f, default_flow_style=False, allow_unicode=True)
-        except Exception as e:
-            print(f"⚠️  상태 저장 실패: {str(e)}")
+        """상태 저장 예약 (save_delay 안의 연속 호출은 한 번만 기록)"""
+        with self._save_lock:
+            self._status_dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.save_delay, self.flush_status)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush_status(self):
+        """예약된 상태 저장을 즉시 수행 (프로세스 종료 시 자동 호출)
+        
+        _write_lock을 먼저 잡으므로 타이머 스레드가 기록 중이면 그 기록이 끝난 뒤에 반환한다.
+        """
+        with self._write_lock:
+            with self._save_lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._status_dirty:
+                    return
+                self._status_dirty = False
+            
+            status_file = self.role_dir / "status.yaml"
+            
+            try:
+                # 임시 파일에 쓴 뒤 교체해 중간에 종료되어도 잘린 파일이 남지 않도록
+                tmp_file = status_file.with_name(status_file.name + '.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    yaml.dump(self.current_status, f, Dumper=SafeDumper,
+                              default_flow_style=False, allow_unicode=True)
+                os.replace(tmp_file, status_file)
+                
+                # 다음 로드 시 YAML 파싱을 피하기 위한 JSON 사본 (YAML 이후에 기록해 더 최신이 되도록)
+                json_file = status_file.with_suffix('.json')
+                tmp_file = json_file.with_name(json_file.name + '.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.current_status, f, ensure_ascii=False, default=str)
+                os.replace(tmp_file, json_file)
+            except RuntimeError:
+                # 기록 중 다른 스레드가 상태를 변경한 경우 다시 예약
+                self.save_status()
+            except Exception as e:
+                print(f"⚠️  상태 저장 실패: {str(e)}")
     
     def get_next_task(self) -> Optional[str]:
         """다음 작업 결정"""
@@ -455,6 +656,23 @@ python3 ../../role_bootstrap.py --report "보고내용"
 """
         return instructions
     
+    def _instructions_hash(self) -> str:
+        """지시사항 내용을 결정하는 값들의 해시"""
+        status = self.current_status
+        # role_info.last_updated 등 보고서에 나오지 않는 값은 제외해야 매 시작마다 바뀌지 않음
+        inputs = {
+            'role': [self.role_id, self.role_name, self.responsibilities,
+                     self.deliverables, self.collaborators],
+            'context': status['context'],
+            'current_status': status['current_status'],
+            'dependencies': status['dependencies'],
+            'pending_tasks': status['tasks']['pending'],
+            # 템플릿(이 파일)이 바뀌면 다시 생성
+            'template': os.stat(__file__).st_mtime_ns
+        }
+        encoded = json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
     def initialize_role_environment(self):
         """역할 환경 초기화"""
         # 필수 디렉토리 생성
@@ -467,10 +685,21 @@ python3 ../../role_bootstrap.py --report "보고내용"
         (comm_base / f"to_{self.role_id}").mkdir(parents=True, exist_ok=True)
         (comm_base / f"from_{self.role_id}").mkdir(parents=True, exist_ok=True)
         
-        # 지시사항 파일 생성
+        # 지시사항 파일 생성 (내용에 영향을 주는 값이 그대로면 생성·기록 생략)
         instructions_file = self.role_dir / "CLAUDE_INSTRUCTIONS.md"
-        with open(instructions_file, 'w', encoding='utf-8') as f:
-            f.write(self.create_claude_instructions())
+        hash_file = self.role_dir / ".instructions.hash"
+        instructions_hash = self._instructions_hash()
+        
+        try:
+            up_to_date = (instructions_file.exists()
+                          and hash_file.read_text(encoding='utf-8') == instructions_hash)
+        except OSError:
+            up_to_date = False
+        
+        if not up_to_date:
+            with open(instructions_file, 'w', encoding='utf-8') as f:
+                f.write(self.create_claude_instructions())
+            hash_file.write_text(instructions_hash, encoding='utf-8')
         
         print("🏗️  역할 환경 초기화 완료")
     
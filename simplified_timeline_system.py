@@ -4,20 +4,30 @@ Simplified Timeline System for Multi-Agent Claude Code
 의미있는 순서 기반 간소화된 타임라인 시스템
 """
 
+import re
 import json
 import yaml
+import hashlib
+from bisect import bisect_left
+from collections import namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+try:
+    # libyaml 기반 C 구현 (순수 파이썬 emitter보다 수 배 빠름)
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml 없이 설치된 PyYAML
+    from yaml import SafeDumper
+
 class DependencyType(Enum):
     PREREQUISITE = "prerequisite"  # 필수 선행
     PARALLEL_OK = "parallel_ok"    # 병렬 가능
     SEQUENCE = "sequence"          # 순차 실행
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimplePhase:
     """간소화된 단계"""
     phase_id: str
@@ -28,6 +38,138 @@ class SimplePhase:
     estimated_duration: str  # "1-2일", "반나절", "2-3시간" 등 의미있는 표현
     success_criteria: List[str]
 
+# 실행 순서 계산 한 번으로 함께 만드는 결과 (실행 순서, 임계 경로, 병렬 작업 기회)
+TimelineParts = namedtuple("TimelineParts", "order critical parallel")
+
+class _TimelineDumper(SafeDumper):
+    """타임라인 저장용 Dumper (DependencyType은 값 문자열로 기록)"""
+    
+    def ignore_aliases(self, data):
+        # 같은 Enum 멤버가 여러 번 나와도 앵커(&id) 없이 값 그대로 기록
+        return isinstance(data, DependencyType) or super().ignore_aliases(data)
+
+_TimelineDumper.add_representer(
+    DependencyType, lambda dumper, value: dumper.represent_str(value.value)
+)
+
+# 기본 단계 정의 (변경되지 않으므로 모든 인스턴스가 공유)
+DEFAULT_PHASES: Tuple[SimplePhase, ...] = (
+    SimplePhase(
+        phase_id="P1_UNDERSTANDING",
+        name="프로젝트 이해 및 계획",
+        roles=["project_manager", "product_owner"],
+        key_outputs=["프로젝트 개요", "초기 계획"],
+        dependency_type=DependencyType.SEQUENCE,
+        estimated_duration="반나절",
+        success_criteria=["프로젝트 목표 명확화", "기본 계획 수립"]
+    ),
+    
+    SimplePhase(
+        phase_id="P2_REQUIREMENTS",
+        name="요구사항 정의",
+        roles=["business_analyst", "requirements_analyst"],
+        key_outputs=["비즈니스 요구사항", "기술 요구사항"],
+        dependency_type=DependencyType.SEQUENCE,
+        estimated_duration="1일",
+        success_criteria=["모든 요구사항 문서화", "이해관계자 승인"]
+    ),
+    
+    SimplePhase(
+        phase_id="P3_DESIGN",
+        name="설계",
+        roles=["system_architect", "ui_ux_designer", "database_designer"],
+        key_outputs=["시스템 아키텍처", "UI 설계", "데이터 모델"],
+        dependency_type=DependencyType.PARALLEL_OK,
+        estimated_duration="1-2일",
+        success_criteria=["설계 완료", "기술 검토 통과"]
+    ),
+    
+    SimplePhase(
+        phase_id="P4_DEVELOPMENT",
+        name="개발",
+        roles=["frontend_developer", "backend_developer", "fullstack_developer"],
+        key_outputs=["프론트엔드 앱", "백엔드 API", "데이터베이스"],
+        dependency_type=DependencyType.PARALLEL_OK,
+        estimated_duration="2-3일",
+        success_criteria=["모든 기능 구현", "단위 테스트 완료"]
+    ),
+    
+    SimplePhase(
+        phase_id="P5_TESTING",
+        name="테스트 및 품질검증",
+        roles=["qa_tester", "automation_tester", "performance_tester"],
+        key_outputs=["테스트 결과", "품질 보고서"],
+        dependency_type=DependencyType.PARALLEL_OK,
+        estimated_duration="1일",
+        success_criteria=["모든 테스트 통과", "품질 기준 달성"]
+    ),
+    
+    SimplePhase(
+        phase_id="P6_DEPLOYMENT",
+        name="배포 및 운영준비",
+        roles=["devops_engineer", "infrastructure_engineer", "sre_engineer"],
+        key_outputs=["배포된 시스템", "운영 가이드"],
+        dependency_type=DependencyType.SEQUENCE,
+        estimated_duration="반나절",
+        success_criteria=["성공적 배포", "운영 환경 준비"]
+    )
+)
+
+# 기간 표현별 일수
+DURATION_MAPPING: Dict[str, float] = {
+    "2-3시간": 0.3,
+    "반나절": 0.5,
+    "1일": 1.0,
+    "1-2일": 1.5,
+    "2-3일": 2.5
+}
+
+# 일수 상한 -> 기간 표현 (bisect로 조회, 마지막 상한을 넘으면 "N일")
+DAYS_TO_LABEL: Tuple[Tuple[float, str], ...] = (
+    (0.3, "2-3시간"),
+    (0.5, "반나절"),
+    (1.0, "1일"),
+    (2.0, "1-2일"),
+    (3.0, "2-3일")
+)
+_DAY_BOUNDARIES = tuple(days for days, _ in DAYS_TO_LABEL)
+
+# 복잡도 레벨별 기간 배수
+COMPLEXITY_MULTIPLIER: Dict[str, float] = {
+    'low': 1.0,
+    'medium': 1.3,
+    'high': 1.6
+}
+
+def _duration_label(days: float) -> str:
+    """일수를 의미있는 기간 표현으로 변환 (days 이상인 첫 상한의 표현)"""
+    index = bisect_left(_DAY_BOUNDARIES, days)
+    if index < len(DAYS_TO_LABEL):
+        return DAYS_TO_LABEL[index][1]
+    return f"{int(days)}일"
+
+# 복잡도 레벨별 (원래 기간 표현 -> 조정된 표현, 알 수 없는 표현(1일로 간주)의 조정 결과)
+_ADJUSTED_DURATIONS: Dict[str, Tuple[Dict[str, str], str]] = {
+    level: (
+        {label: _duration_label(days * multiplier) for label, days in DURATION_MAPPING.items()},
+        _duration_label(1.0 * multiplier)
+    )
+    for level, multiplier in COMPLEXITY_MULTIPLIER.items()
+}
+
+# 역할별 병렬 그룹
+PARALLEL_MAPPING: Dict[str, List[str]] = {
+    'design': ['system_architect', 'ui_ux_designer', 'database_designer'],
+    'development': ['frontend_developer', 'backend_developer', 'fullstack_developer'],
+    'testing': ['qa_tester', 'automation_tester', 'performance_tester'],
+    'infrastructure': ['devops_engineer', 'infrastructure_engineer', 'sre_engineer']
+}
+_PARALLEL_GROUP_SETS: Tuple[frozenset, ...] = tuple(frozenset(roles) for roles in PARALLEL_MAPPING.values())
+
+# 프로젝트 설명(소문자 변환 후)에서 찾는 복잡도 키워드 (키워드별 반복 대신 한 번의 검색)
+_REALTIME_RE = re.compile("실시간|real-time|알림")
+_MOBILE_RE = re.compile("모바일|mobile|반응형")
+
 class SimplifiedTimelineSystem:
     """간소화된 타임라인 시스템"""
     
@@ -37,72 +179,10 @@ class SimplifiedTimelineSystem:
         self.timeline_dir.mkdir(exist_ok=True)
         
         # 간소화된 단계 정의
-        self.phases = self._define_simplified_phases()
-        
-    def _define_simplified_phases(self) -> List[SimplePhase]:
-        """간소화된 단계 정의"""
-        
-        return [
-            SimplePhase(
-                phase_id="P1_UNDERSTANDING",
-                name="프로젝트 이해 및 계획",
-                roles=["project_manager", "product_owner"],
-                key_outputs=["프로젝트 개요", "초기 계획"],
-                dependency_type=DependencyType.SEQUENCE,
-                estimated_duration="반나절",
-                success_criteria=["프로젝트 목표 명확화", "기본 계획 수립"]
-            ),
-            
-            SimplePhase(
-                phase_id="P2_REQUIREMENTS",
-                name="요구사항 정의",
-                roles=["business_analyst", "requirements_analyst"],
-                key_outputs=["비즈니스 요구사항", "기술 요구사항"],
-                dependency_type=DependencyType.SEQUENCE,
-                estimated_duration="1일",
-                success_criteria=["모든 요구사항 문서화", "이해관계자 승인"]
-            ),
-            
-            SimplePhase(
-                phase_id="P3_DESIGN",
-                name="설계",
-                roles=["system_architect", "ui_ux_designer", "database_designer"],
-                key_outputs=["시스템 아키텍처", "UI 설계", "데이터 모델"],
-                dependency_type=DependencyType.PARALLEL_OK,
-                estimated_duration="1-2일",
-                success_criteria=["설계 완료", "기술 검토 통과"]
-            ),
-            
-            SimplePhase(
-                phase_id="P4_DEVELOPMENT",
-                name="개발",
-                roles=["frontend_developer", "backend_developer", "fullstack_developer"],
-                key_outputs=["프론트엔드 앱", "백엔드 API", "데이터베이스"],
-                dependency_type=DependencyType.PARALLEL_OK,
-                estimated_duration="2-3일",
-                success_criteria=["모든 기능 구현", "단위 테스트 완료"]
-            ),
-            
-            SimplePhase(
-                phase_id="P5_TESTING",
-                name="테스트 및 품질검증",
-                roles=["qa_tester", "automation_tester", "performance_tester"],
-                key_outputs=["테스트 결과", "품질 보고서"],
-                dependency_type=DependencyType.PARALLEL_OK,
-                estimated_duration="1일",
-                success_criteria=["모든 테스트 통과", "품질 기준 달성"]
-            ),
-            
-            SimplePhase(
-                phase_id="P6_DEPLOYMENT",
-                name="배포 및 운영준비",
-                roles=["devops_engineer", "infrastructure_engineer", "sre_engineer"],
-                key_outputs=["배포된 시스템", "운영 가이드"],
-                dependency_type=DependencyType.SEQUENCE,
-                estimated_duration="반나절",
-                success_criteria=["성공적 배포", "운영 환경 준비"]
-            )
-        ]
+        self.phases = DEFAULT_PHASES
+        
+        # 마지막으로 저장한 타임라인 (내용 해시, 파일 경로) - 같은 내용이면 다시 쓰지 않음
+        self._last_saved: Optional[tuple] = None
     
     def generate_smart_timeline(self, project_config: Dict[str, Any]) -> Dict[str, Any]:
         """지능적 타임라인 생성"""
@@ -113,19 +193,19 @@ class SimplifiedTimelineSystem:
         # 단계별 예상 시간 조정
         adjusted_phases = self._adjust_phase_durations(complexity)
         
-        # 의존성 기반 실행 순서 계산
-        execution_order = self._calculate_execution_order(adjusted_phases)
+        # 의존성 기반 실행 순서 계산 (임계 경로·병렬 작업 기회도 같은 순회에서 수집)
+        parts = self._calculate_execution_order(adjusted_phases)
         
         # 전체 타임라인 생성
         timeline = {
             'project_name': project_config.get('project_name', 'Unknown'),
             'complexity_level': complexity['level'],
             'total_estimated_duration': self._calculate_total_duration(adjusted_phases),
-            'execution_phases': execution_order,
-            'critical_path': self._identify_critical_path(execution_order),
-            'parallel_opportunities': self._identify_parallel_work(execution_order),
+            'execution_phases': parts.order,
+            'critical_path': parts.critical,
+            'parallel_opportunities': parts.parallel,
             'risk_factors': complexity['risk_factors'],
-            'recommendations': self._generate_timeline_recommendations(complexity, execution_order)
+            'recommendations': self._generate_timeline_recommendations(complexity, parts)
         }
         
         return timeline
@@ -152,12 +232,12 @@ class SimplifiedTimelineSystem:
         
         # 실시간 기능 여부
         description = project_config.get('description', '').lower()
-        if any(word in description for word in ['실시간', 'real-time', '알림']):
+        if _REALTIME_RE.search(description) is not None:
             complexity_score += 2
             risk_factors.append("실시간 기능 요구")
         
         # 모바일 지원 여부
-        if any(word in description for word in ['모바일', 'mobile', '반응형']):
+        if _MOBILE_RE.search(description) is not None:
             complexity_score += 1
             risk_factors.append("다중 플랫폼 지원")
         
@@ -179,84 +259,78 @@ class SimplifiedTimelineSystem:
         """복잡도에 따른 단계별 기간 조정"""
         
         adjusted_phases = []
-        multiplier = {
-            'low': 1.0,
-            'medium': 1.3,
-            'high': 1.6
-        }[complexity['level']]
+        level = complexity['level']
         
         for phase in self.phases:
             adjusted_phase = {
                 'phase_id': phase.phase_id,
                 'name': phase.name,
-                'roles': phase.roles,
-                'key_outputs': phase.key_outputs,
+                'roles': list(phase.roles),
+                'key_outputs': list(phase.key_outputs),
                 'dependency_type': phase.dependency_type,
                 'original_duration': phase.estimated_duration,
-                'adjusted_duration': self._adjust_duration(phase.estimated_duration, multiplier),
-                'success_criteria': phase.success_criteria,
+                'adjusted_duration': self._adjust_duration(phase.estimated_duration, level),
+                'success_criteria': list(phase.success_criteria),
                 'complexity_impact': self._calculate_phase_complexity_impact(phase, complexity)
             }
             adjusted_phases.append(adjusted_phase)
         
         return adjusted_phases
     
-    def _adjust_duration(self, original_duration: str, multiplier: float) -> str:
-        """기간 조정"""
-        
-        duration_mapping = {
-            "반나절": 0.5,
-            "1일": 1.0,
-            "1-2일": 1.5,
-            "2-3일": 2.5,
-            "2-3시간": 0.3
-        }
-        
-        original_days = duration_mapping.get(original_duration, 1.0)
-        adjusted_days = original_days * multiplier
+    def _adjust_duration(self, original_duration: str, level: str) -> str:
+        """기간 조정 (복잡도 레벨별로 미리 계산한 표 조회)"""
         
-        # 조정된 기간을 의미있는 표현으로 변환
-        if adjusted_days <= 0.3:
-            return "2-3시간"
-        elif adjusted_days <= 0.5:
-            return "반나절"
-        elif adjusted_days <= 1.0:
-            return "1일"
-        elif adjusted_days <= 2.0:
-            return "1-2일"
-        elif adjusted_days <= 3.0:
-            return "2-3일"
-        else:
-            return f"{int(adjusted_days)}일"
+        adjusted, default = _ADJUSTED_DURATIONS[level]
+        return adjusted.get(original_duration, default)
     
-    def _calculate_execution_order(self, phases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """실행 순서 계산"""
+    def _calculate_execution_order(self, phases: List[Dict[str, Any]]) -> TimelineParts:
+        """실행 순서 계산 (임계 경로와 병렬 작업 기회를 같은 순회에서 함께 구성)"""
         
         execution_order = []
+        critical_path = []
+        parallel_opportunities = []
         
         for phase in phases:
             if phase['dependency_type'] == DependencyType.SEQUENCE:
                 # 순차 실행 단계
-                execution_order.append({
+                order = {
                     'phase': phase,
                     'execution_type': 'sequential',
                     'can_start_after': execution_order[-1]['phase']['phase_id'] if execution_order else None,
                     'estimated_start': self._calculate_start_time(execution_order),
                     'roles_needed': len(phase['roles'])
-                })
+                }
             
             elif phase['dependency_type'] == DependencyType.PARALLEL_OK:
                 # 병렬 실행 가능 단계
-                execution_order.append({
+                parallel_groups = self._identify_parallel_groups(phase)
+                order = {
                     'phase': phase,
                     'execution_type': 'parallel_possible',
                     'can_start_after': execution_order[-1]['phase']['phase_id'] if execution_order else None,
                     'estimated_start': self._calculate_start_time(execution_order),
                     'roles_needed': len(phase['roles']),
-                    'parallel_groups': self._identify_parallel_groups(phase)
+                    'parallel_groups': parallel_groups
+                }
+                
+                # 병렬 작업 기회
+                parallel_opportunities.append({
+                    'phase_name': phase['name'],
+                    'parallel_groups': parallel_groups,
+                    'time_savings': "20-30% 시간 단축 가능",
+                    'coordination_needed': len(parallel_groups) > 1
                 })
+            
+            else:
+                continue
+            
+            execution_order.append(order)
+            
+            # 순차 실행이거나 많은 역할이 필요한 단계를 임계 경로로 간주
+            if order['execution_type'] == 'sequential' or order['roles_needed'] >= 3:
+                critical_path.append(phase['name'])
         
-        return execution_order
+        return TimelineParts(execution_order, critical_path, parallel_opportunities)
     
     def _calculate_start_time(self, existing_phases: List[Dict[str, Any]]) -> str:
         """시작 시간 계산"""
@@ -274,17 +348,10 @@ class SimplifiedTimelineSystem:
         
         roles = phase['roles']
         
-        # 역할별 병렬 그룹 정의
-        parallel_mapping = {
-            'design': ['system_architect', 'ui_ux_designer', 'database_designer'],
-            'development': ['frontend_developer', 'backend_developer', 'fullstack_developer'],
-            'testing': ['qa_tester', 'automation_tester', 'performance_tester'],
-            'infrastructure': ['devops_engineer', 'infrastructure_engineer', 'sre_engineer']
-        }
-        
         groups = []
-        for group_name, group_roles in parallel_mapping.items():
-            intersection = list(set(roles) & set(group_roles))
+        for group_roles in _PARALLEL_GROUP_SETS:
+            # 단계의 역할 순서를 유지한 교집합
+            intersection = [role for role in roles if role in group_roles]
             if intersection:
                 groups.append(intersection)
         
@@ -293,14 +360,6 @@ class SimplifiedTimelineSystem:
     def _calculate_total_duration(self, phases: List[Dict[str, Any]]) -> str:
         """전체 기간 계산"""
         
-        duration_mapping = {
-            "2-3시간": 0.3,
-            "반나절": 0.5,
-            "1일": 1.0,
-            "1-2일": 1.5,
-            "2-3일": 2.5
-        }
-        
         # 순차 실행 단계들의 기간 합계
         sequential_total = 0
         for phase in phases:
@@ -309,7 +368,7 @@ class SimplifiedTimelineSystem:
             else:
                 duration = phase['adjusted_duration']
             
-            sequential_total += duration_mapping.get(duration, 1.0)
+            sequential_total += DURATION_MAPPING.get(duration, 1.0)
         
         # 병렬 실행으로 인한 시간 단축 고려
         parallel_savings = sequential_total * 0.2  # 20% 시간 절약 가정
@@ -327,38 +386,6 @@ class SimplifiedTimelineSystem:
         else:
             return f"{int(total_days)}일"
     
-    def _identify_critical_path(self, execution_order: List[Dict[str, Any]]) -> List[str]:
-        """임계 경로 식별"""
-        
-        critical_path = []
-        
-        for order in execution_order:
-            phase = order['phase']
-            
-            # 순차 실행이거나 많은 역할이 필요한 단계를 임계 경로로 간주
-            if (order['execution_type'] == 'sequential' or 
-                order['roles_needed'] >= 3):
-                critical_path.append(phase['name'])
-        
-        return critical_path
-    
-    def _identify_parallel_work(self, execution_order: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """병렬 작업 기회 식별"""
-        
-        parallel_opportunities = []
-        
-        for order in execution_order:
-            if order['execution_type'] == 'parallel_possible':
-                phase = order['phase']
-                parallel_opportunities.append({
-                    'phase_name': phase['name'],
-                    'parallel_groups': order.get('parallel_groups', []),
-                    'time_savings': "20-30% 시간 단축 가능",
-                    'coordination_needed': len(order.get('parallel_groups', [])) > 1
-                })
-        
-        return parallel_opportunities
-    
     def _calculate_phase_complexity_impact(self, phase: SimplePhase, complexity: Dict[str, Any]) -> Dict[str, Any]:
         """단계별 복잡도 영향 계산"""
         
@@ -394,7 +421,7 @@ class SimplifiedTimelineSystem:
         
         return impact
     
-    def _generate_timeline_recommendations(self, complexity: Dict[str, Any], execution_order: List[Dict[str, Any]]) -> List[str]:
+    def _generate_timeline_recommendations(self, complexity: Dict[str, Any], parts: TimelineParts) -> List[str]:
         """타임라인 권고사항 생성"""
         
         recommendations = []
@@ -408,12 +435,11 @@ class SimplifiedTimelineSystem:
             ])
         
         # 병렬 작업 권고사항
-        parallel_phases = [order for order in execution_order if order['execution_type'] == 'parallel_possible']
-        if len(parallel_phases) >= 2:
+        if len(parts.parallel) >= 2:
             recommendations.append("병렬 작업을 통해 전체 일정을 20-30% 단축할 수 있습니다")
         
         # 임계 경로 권고사항
-        critical_path = self._identify_critical_path(execution_order)
+        critical_path = parts.critical
         if len(critical_path) >= 3:
             recommendations.append(f"임계 경로 단계({', '.join(critical_path)})에 우선순위를 두세요")
         
@@ -453,6 +479,16 @@ class SimplifiedTimelineSystem:
     def save_simplified_timeline(self, timeline: Dict[str, Any]) -> str:
         """간소화된 타임라인 저장"""
         
+        # YAML 형태로 직렬화 (가독성 우선)
+        content = yaml.dump(timeline, Dumper=_TimelineDumper, default_flow_style=False,
+                            allow_unicode=True, sort_keys=False).encode('utf-8')
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        
+        # 직전에 저장한 타임라인과 내용이 같으면 기존 파일 재사용
+        if self._last_saved is not None and self._last_saved[0] == digest and Path(self._last_saved[1]).exists():
+            print(f"📅 간소화된 타임라인 변경 없음: {self._last_saved[1]}")
+            return self._last_saved[1]
+        
         # 파일명 생성
         project_name = timeline['project_name'].replace(' ', '_').lower()
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -460,9 +496,9 @@ class SimplifiedTimelineSystem:
         
         file_path = self.timeline_dir / filename
         
-        # YAML 형태로 저장 (가독성 우선)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            yaml.dump(timeline, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        self._last_saved = (digest, str(file_path))
         
         print(f"📅 간소화된 타임라인 저장: {file_path}")
         return str(file_path)
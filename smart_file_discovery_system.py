@@ -5,20 +5,48 @@ Smart File Discovery System for Multi-Agent Claude Code
 """
 
 import os
+import ast
 import json
-import yaml
 import hashlib
 import mimetypes
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable
 from enum import Enum
 from dataclasses import dataclass, asdict
+from contextlib import contextmanager
 import sqlite3
 import threading
+import queue
 import time
 import fnmatch
 import re
+import heapq
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # 선택적 의존성 - 없으면 주기적 재스캔
+    Observer = None
+    FileSystemEventHandler = object
+
+try:
+    import orjson
+except ImportError:  # 선택적 의존성
+    orjson = None
+
+try:
+    import blake3
+except ImportError:  # 선택적 의존성 - 없으면 hashlib sha256
+    blake3 = None
+
+# Python import 문 (import X / from X import ...) 을 한 번의 스캔으로 추출
+_PY_IMPORT_RE = re.compile(
+    r'^\s*(?:import\s+([a-zA-Z_][a-zA-Z0-9_]*)|from\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+import)',
+    re.MULTILINE
+)
 
 class FileType(Enum):
     """파일 타입"""
@@ -101,6 +129,144 @@ class SearchQuery:
     exclude_patterns: Optional[List[str]] = None
     limit: Optional[int] = None
 
+# FileMetadata 필드 순서의 file_metadata 컬럼 (검색 결과를 위치 기반으로 바로 변환)
+_FILE_METADATA_COLUMNS = (
+    'file_path, file_name, file_type, file_status, size_bytes, created_at, modified_at, '
+    'last_accessed, access_count, access_pattern, content_hash, mime_type, encoding, '
+    'language, framework, dependencies, tags, purpose, role_ownership, project_phase, '
+    'quality_score, complexity_score, maintainability_score'
+)
+
+# 메타데이터 저장 (새 파일은 삽입, 기존 파일은 분석 결과 컬럼만 갱신)
+# 접근 통계(last_accessed, access_count, access_pattern)와 최초 색인 시각은 재분석 시 유지하고,
+# 내용/수정 시간/상태가 모두 같으면 행을 다시 쓰지 않음
+_FILE_METADATA_ACCESS_COLUMNS = ('last_accessed', 'access_count', 'access_pattern')
+_FILE_METADATA_UPSERT_SQL = (
+    f"INSERT INTO file_metadata ({_FILE_METADATA_COLUMNS}, indexed_at, updated_at) "
+    f"VALUES ({', '.join('?' * (_FILE_METADATA_COLUMNS.count(',') + 3))}) "
+    "ON CONFLICT (file_path) DO UPDATE SET "
+    + ', '.join(f"{column} = excluded.{column}"
+                for column in _FILE_METADATA_COLUMNS.split(', ')[1:] + ['updated_at']
+                if column not in _FILE_METADATA_ACCESS_COLUMNS)
+    + " WHERE file_metadata.content_hash != excluded.content_hash"
+    " OR file_metadata.modified_at != excluded.modified_at"
+    " OR file_metadata.file_status != excluded.file_status"
+)
+
+# 저장된 값 -> Enum 멤버 (행마다 Enum 호출 검증 없이 딕셔너리 조회)
+_FILE_TYPE_BY_VALUE = {file_type.value: file_type for file_type in FileType}
+_FILE_STATUS_BY_VALUE = {file_status.value: file_status for file_status in FileStatus}
+_ACCESS_PATTERN_BY_VALUE = {access_pattern.value: access_pattern for access_pattern in AccessPattern}
+
+# 주석으로 시작하는 줄 (유지보수성 점수의 주석 비율 계산용, 소스 bytes에 적용)
+_COMMENT_LINE_RE = re.compile(rb'^[ \t\r\f\v]*(?:#|//|/\*)', re.MULTILINE)
+
+# 작업/파일명 키워드 분리용 단어 패턴과 불용어
+_WORD_RE = re.compile(r'\w+')
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# 대량 재스캔 동안 삭제했다가 쓰기 후 다시 만드는 보조 인덱스 (이름 -> 생성 SQL)
+_BULK_DROPPABLE_INDEXES = {
+    'idx_modified_at': 'CREATE INDEX IF NOT EXISTS idx_modified_at ON file_metadata (modified_at)',
+    'idx_role_ownership': 'CREATE INDEX IF NOT EXISTS idx_role_ownership ON file_metadata (role_ownership)',
+    'idx_project_phase': 'CREATE INDEX IF NOT EXISTS idx_project_phase ON file_metadata (project_phase)',
+    'idx_quality_score': 'CREATE INDEX IF NOT EXISTS idx_quality_score ON file_metadata (quality_score)',
+    # 프로젝트 개요 집계를 테이블 대신 이 인덱스만 읽어 한 번에 계산
+    # (그룹 순서로 정렬되어 임시 B-트리 없음, file_status는 부분 인덱스 조건 확인용으로 포함)
+    'idx_overview': ("CREATE INDEX IF NOT EXISTS idx_overview ON file_metadata "
+                     "(file_type, role_ownership, access_pattern, quality_score, file_status) "
+                     "WHERE file_status != 'deleted'"),
+}
+
+def _dumps_list(values: List[str]) -> str:
+    """메타데이터 리스트 컬럼 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(values).decode('utf-8')
+    return json.dumps(values)
+
+def _loads_list(text: Optional[str]) -> List[str]:
+    """메타데이터 리스트 컬럼 역직렬화 (빈 값은 빈 리스트, 대부분 파일의 빈 dependencies '[]'는 파싱 생략)"""
+    if not text or text == '[]':
+        return []
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+def _guess_mime_type(file_name: str) -> str:
+    """파일명의 MIME 타입 (guess_type은 마지막 두 확장자만 보므로 그 조합으로 캐시)"""
+    base, ext = os.path.splitext(file_name)
+    return _guess_mime_type_for_suffixes(os.path.splitext(base)[1] + ext)
+
+@lru_cache(maxsize=1024)
+def _guess_mime_type_for_suffixes(suffixes: str) -> str:
+    """확장자 조합 (예: '.tar.gz')의 MIME 타입, 알 수 없으면 application/octet-stream"""
+    mime_type, _ = mimetypes.guess_type('file' + suffixes)
+    return mime_type or 'application/octet-stream'
+
+# 파일명 키워드 -> 목적 (딕셔너리 순서가 우선순위)
+_PURPOSE_MAPPING = {
+    'main': '메인 진입점',
+    'index': '인덱스 파일',
+    'config': '설정 파일',
+    'test': '테스트 파일',
+    'util': '유틸리티 함수',
+    'helper': '헬퍼 함수',
+    'model': '데이터 모델',
+    'view': '뷰 컴포넌트',
+    'controller': '컨트롤러',
+    'service': '서비스 로직',
+    'api': 'API 인터페이스',
+    'component': 'UI 컴포넌트'
+}
+
+# 경로 키워드 -> 담당 역할 (딕셔너리 순서가 우선순위)
+_ROLE_INDICATORS = {
+    'frontend': ['frontend', 'ui', 'component', 'view', 'css', 'html'],
+    'backend': ['backend', 'api', 'server', 'service', 'model'],
+    'qa_tester': ['test', 'spec', 'testing'],
+    'devops': ['deploy', 'docker', 'kubernetes', 'ci', 'cd'],
+    'database_designer': ['migration', 'schema', 'database', 'sql'],
+    'business_analyst': ['requirement', 'spec', 'business']
+}
+
+@lru_cache(maxsize=4096)
+def _infer_purpose_from_name(file_name: str) -> Optional[str]:
+    """소문자 파일명에서 목적 추론 (index.js, __init__.py처럼 반복되는 이름은 캐시)"""
+    for keyword, purpose in _PURPOSE_MAPPING.items():
+        if keyword in file_name:
+            return purpose
+    return None
+
+@lru_cache(maxsize=1024)
+def _compile_content_regex(pattern: str) -> re.Pattern:
+    """콘텐츠 검색용 (대소문자 무시) 정규식 컴파일 (같은 패턴은 캐시)"""
+    return re.compile(pattern, re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
+def _lowercase_words(text: str) -> frozenset:
+    """파일명/목적 문자열의 소문자 단어 집합 (반복되는 이름과 목적 문구는 캐시)"""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+class _ProjectFileHandler(FileSystemEventHandler):
+    """프로젝트 파일 생성/수정/삭제/이동 이벤트 전달 (callback(path, deleted))"""
+    
+    def __init__(self, callback: Callable[[str, bool], None]):
+        super().__init__()
+        self.callback = callback
+    
+    def on_created(self, event):
+        self.callback(event.src_path, False)
+    
+    def on_modified(self, event):
+        # 디렉토리 수정 이벤트는 하위 파일 변경마다 발생하므로 무시
+        if not event.is_directory:
+            self.callback(event.src_path, False)
+    
+    def on_deleted(self, event):
+        self.callback(event.src_path, True)
+    
+    def on_moved(self, event):
+        self.callback(event.src_path, True)
+        self.callback(event.dest_path, False)
+
 class SmartFileDiscoverySystem:
     """지능적 파일 발견 시스템"""
     
@@ -112,11 +278,36 @@ class SmartFileDiscoverySystem:
         # 디렉토리 생성
         self.discovery_dir.mkdir(exist_ok=True)
         
-        # 데이터베이스 초기화
+        # 데이터베이스 초기화 (스레드별 연결 재사용, 쓰기는 단일 락으로 직렬화)
+        self._tls = threading.local()
+        self._write_lock = threading.RLock()
+        # close()에서 닫을 수 있도록 생성한 모든 연결 보관
+        self._connections: List[sqlite3.Connection] = []
         self._init_database()
         
         # 파일 탐지 규칙
         self.detection_rules = self._initialize_detection_rules()
+        # 'dir/*' 형태는 디렉토리 이름 패턴으로 분리해 스캔 시 하위 트리 전체를 건너뜀
+        exclude_patterns = self.detection_rules['exclude_patterns']
+        self._exclude_dir_re = self._compile_patterns(
+            [pattern[:-2] for pattern in exclude_patterns if pattern.endswith('/*')]
+        )
+        self._exclude_re = self._compile_patterns(
+            [pattern for pattern in exclude_patterns if not pattern.endswith('/*')]
+        )
+        # 타입별 패턴은 소문자 경로와 비교 (딕셔너리 순서가 우선순위)
+        # '*.ext' 형태는 확장자 -> 타입 딕셔너리로, 나머지 패턴만 타입별 정규식으로 컴파일
+        self._file_type_by_suffix: Dict[str, FileType] = {}
+        self._file_type_res: Dict[FileType, Optional[re.Pattern]] = {}
+        for file_type, patterns in self.detection_rules['file_type_patterns'].items():
+            other_patterns = []
+            for pattern in (pattern.lower() for pattern in patterns):
+                suffix = pattern[2:]
+                if pattern.startswith('*.') and suffix and not any(c in suffix for c in '*?[./'):
+                    self._file_type_by_suffix.setdefault(suffix, file_type)
+                else:
+                    other_patterns.append(pattern)
+            self._file_type_res[file_type] = self._compile_patterns(other_patterns) if other_patterns else None
         
         # 캐시
         self.metadata_cache: Dict[str, FileMetadata] = {}
@@ -124,17 +315,89 @@ class SmartFileDiscoverySystem:
         
         # 백그라운드 스캔 설정
         self.scan_active = True
+        # 스캔 중 한 트랜잭션으로 저장할 최대 메타데이터 행 수
+        self.scan_batch_size = 10000
+        # 강제 재스캔에서 이 수 이상의 파일을 다시 쓰면 보조 인덱스를 재생성
+        self.bulk_index_rebuild_threshold = 5000
+        # 스캔 시 파일 분석 병렬 스레드 수
+        self.scan_workers = min(8, (os.cpu_count() or 1) + 4)
+        # 검색 시 콘텐츠 정규식을 적용할 최대 파일 크기 (초과 파일은 매치되지 않은 것으로 처리)
+        self.max_regex_scan_bytes = 10 * 1024 * 1024
         self.last_scan_time = datetime.min
         
+        # 파일 접근 기록은 큐에 모아 백그라운드에서 일괄 저장
+        self.access_flush_interval = 0.1
+        self.access_batch_size = 1000
+        self._access_queue = queue.SimpleQueue()
+        self.access_writer_thread = threading.Thread(target=self._write_access_log_loop, daemon=True)
+        self.access_writer_thread.start()
+        
+        # 파일 변경 감시 (watchdog 이벤트를 모아 변경된 파일만 반영)
+        self.file_poll_interval = 300
+        self.file_change_debounce = 1.0
+        self.full_rescan_interval = timedelta(hours=24)
+        self._pending_file_changes: Dict[str, bool] = {}
+        self._file_change_lock = threading.Lock()
+        self._file_change_event = threading.Event()
+        self.file_observer = None
+        self._start_file_observer()
+        
         # 실시간 모니터링 스레드
         self.monitor_thread = threading.Thread(target=self._monitor_file_changes, daemon=True)
         self.monitor_thread.start()
         
         print("🔍 Smart File Discovery System 초기화 완료")
     
+    def _connect(self) -> sqlite3.Connection:
+        """PRAGMA가 적용된 데이터베이스 연결 생성"""
+        conn = sqlite3.connect(self.metadata_db, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        # synchronous 등은 연결 단위 설정이므로 연결 생성 시 한 번만 적용
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA busy_timeout=60000")
+        # INSERT OR REPLACE로 지워지는 행에도 DELETE 트리거(FTS 인덱스 동기화)가 실행되도록
+        conn.execute("PRAGMA recursive_triggers=ON")
+        with self._write_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def _conn(self) -> sqlite3.Connection:
+        """현재 스레드의 데이터베이스 연결 (최초 호출 시 생성)"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._tls.conn = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE/COMMIT, 실패 시 ROLLBACK)"""
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
     def _init_database(self):
         """데이터베이스 초기화"""
-        with sqlite3.connect(self.metadata_db) as conn:
+        with self._write_lock:
+            conn = self._conn()
+            # page_size는 WAL 모드에서 바꿀 수 없으므로 최초 생성 시 rollback 저널 상태에서 먼저 맞춤
+            if conn.execute("PRAGMA page_size").fetchone()[0] != 4096:
+                conn.execute("PRAGMA journal_mode=DELETE")
+                conn.execute("PRAGMA page_size=4096")
+                conn.execute("VACUUM")
+            # WAL 모드는 DB 파일에 영구 저장되어 모니터 스레드 쓰기 중에도 검색 읽기가 막히지 않음
+            conn.execute("PRAGMA journal_mode=WAL")
+        
+        with self._transaction() as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS file_metadata (
                     file_path TEXT PRIMARY KEY,
@@ -147,7 +410,7 @@ class SmartFileDiscoverySystem:
                     last_accessed TEXT,
                     access_count INTEGER DEFAULT 0,
                     access_pattern TEXT NOT NULL,
-                    content_hash TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,  -- hex digest (blake3 또는 sha256)
                     mime_type TEXT NOT NULL,
                     encoding TEXT,
                     language TEXT,
@@ -189,13 +452,90 @@ class SmartFileDiscoverySystem:
                 )
             ''')
             
+            # 태그 검색용 정규화 테이블 (file_metadata.tags JSON과 함께 저장)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS file_tags (
+                    file_path TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (file_path, tag),
+                    FOREIGN KEY (file_path) REFERENCES file_metadata (file_path)
+                )
+            ''')
+            self._backfill_file_tags(conn)
+            
+            # 키워드 검색용 전문 검색 인덱스 (FTS5 미지원 SQLite에서는 LIKE 검색 유지)
+            self._fts_enabled = self._init_keyword_index(conn)
+            
             # 인덱스 생성
             conn.execute('CREATE INDEX IF NOT EXISTS idx_file_type ON file_metadata (file_type)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_file_status ON file_metadata (file_status)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_modified_at ON file_metadata (modified_at)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_role_ownership ON file_metadata (role_ownership)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_project_phase ON file_metadata (project_phase)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_quality_score ON file_metadata (quality_score)')
+            for create_sql in _BULK_DROPPABLE_INDEXES.values():
+                conn.execute(create_sql)
+            # smart_search의 주요 필터 조합과 정렬 순서용 복합/부분 인덱스
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_tag ON file_tags (tag, file_path)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_status_type_role ON file_metadata (file_status, file_type, role_ownership)')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_quality_modified ON file_metadata (quality_score DESC, modified_at DESC) WHERE file_status != 'deleted'")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_modified_partial ON file_metadata (modified_at) WHERE file_status != 'deleted'")
+            # 접근 기록 배치마다 실행하는 파일별 최근 30일 접근 횟수 조회용
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_access_log_path_time ON access_log (file_path, accessed_at)')
+    
+    def _init_keyword_index(self, conn: sqlite3.Connection) -> bool:
+        """file_metadata의 파일명/목적/태그 FTS5 인덱스와 동기화 트리거 생성
+        
+        trigram 토크나이저로 LIKE '%키워드%'와 같은 부분 문자열 검색을 인덱스로 처리.
+        FTS5 또는 trigram을 지원하지 않는 SQLite면 False 반환.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'file_metadata_fts'"
+        ).fetchone()
+        
+        try:
+            conn.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS file_metadata_fts USING fts5(
+                    file_name, purpose, tags,
+                    content='file_metadata', content_rowid='rowid', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            return False
+        
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS file_metadata_fts_insert AFTER INSERT ON file_metadata BEGIN
+                INSERT INTO file_metadata_fts (rowid, file_name, purpose, tags)
+                VALUES (new.rowid, new.file_name, new.purpose, new.tags);
+            END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS file_metadata_fts_delete AFTER DELETE ON file_metadata BEGIN
+                INSERT INTO file_metadata_fts (file_metadata_fts, rowid, file_name, purpose, tags)
+                VALUES ('delete', old.rowid, old.file_name, old.purpose, old.tags);
+            END
+        ''')
+        # 접근 횟수/상태 갱신에는 인덱스를 건드리지 않도록 검색 대상 컬럼 변경 시에만 동기화
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS file_metadata_fts_update
+            AFTER UPDATE OF file_name, purpose, tags ON file_metadata BEGIN
+                INSERT INTO file_metadata_fts (file_metadata_fts, rowid, file_name, purpose, tags)
+                VALUES ('delete', old.rowid, old.file_name, old.purpose, old.tags);
+                INSERT INTO file_metadata_fts (rowid, file_name, purpose, tags)
+                VALUES (new.rowid, new.file_name, new.purpose, new.tags);
+            END
+        ''')
+        
+        # 인덱스 도입 이전 DB는 기존 행으로 인덱스 구성
+        if not exists:
+            conn.execute("INSERT INTO file_metadata_fts (file_metadata_fts) VALUES ('rebuild')")
+        return True
+    
+    def _backfill_file_tags(self, conn: sqlite3.Connection):
+        """file_tags 테이블 도입 이전 DB의 태그를 JSON 컬럼에서 옮겨 채움"""
+        if conn.execute("SELECT 1 FROM file_tags LIMIT 1").fetchone():
+            return
+        
+        tag_rows = []
+        for file_path, tags in conn.execute("SELECT file_path, tags FROM file_metadata WHERE tags IS NOT NULL"):
+            tag_rows.extend((file_path, tag) for tag in _loads_list(tags))
+        conn.executemany("INSERT OR IGNORE INTO file_tags (file_path, tag) VALUES (?, ?)", tag_rows)
     
     def _initialize_detection_rules(self) -> Dict[str, Any]:
         """파일 탐지 규칙 초기화"""
@@ -295,40 +635,80 @@ class SmartFileDiscoverySystem:
         }
         
         try:
-            # 현재 파일들 스캔
+            # 현재 파일들 스캔 (메타데이터 행은 모아서 배치 단위 트랜잭션으로 저장)
             current_files = set()
+            pending_metadata = []
+            # 이전 스캔 결과 (수정 시간과 크기가 같으면 해시/분석 생략)
+            tracked_files = self._get_tracked_file_signatures()
+            # 분석이 필요한 (entry, 이전 스캔 결과) 목록
+            to_analyze = []
             
-            for file_path in self._scan_directory(self.project_root):
+            for entry in self._scan_directory(self.project_root):
                 try:
-                    current_files.add(str(file_path))
+                    current_files.add(entry.path)
                     
                     # 파일이 제외 패턴에 해당하는지 확인
-                    if self._should_exclude_file(file_path):
+                    if self._should_exclude_file(entry):
                         continue
                     
-                    # 메타데이터 생성/업데이트
-                    metadata = self._analyze_file(file_path)
-                    if metadata:
-                        if self._is_new_or_modified(metadata):
-                            self._save_file_metadata(metadata)
-                            scan_results["files_updated"] += 1
-                        scan_results["files_discovered"] += 1
+                    tracked = tracked_files.get(entry.path)
+                    if tracked is not None:
+                        stat = entry.stat()
+                        if (tracked[0] == datetime.fromtimestamp(stat.st_mtime).isoformat() and
+                                tracked[1] == stat.st_size):
+                            scan_results["files_discovered"] += 1
+                            continue
+                    
+                    to_analyze.append((entry, tracked))
                     
                 except Exception as e:
-                    scan_results["errors"].append(f"Error processing {file_path}: {str(e)}")
+                    scan_results["errors"].append(f"Error processing {entry.path}: {str(e)}")
+            
+            # 강제 재스캔으로 많은 행을 다시 쓸 때는 보조 인덱스를 내렸다가 쓰기 후 한 번에 재생성
+            drop_indexes = force_rescan and len(to_analyze) >= self.bulk_index_rebuild_threshold
+            if drop_indexes:
+                self._drop_bulk_indexes()
+            
+            try:
+                # 메타데이터 생성/업데이트 (파일 읽기/해시는 GIL을 놓으므로 스레드 풀에서 병렬 분석,
+                # DB 쓰기는 이 스레드에서만 수행)
+                with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+                    analyzed = pool.map(self._analyze_file, [entry for entry, _ in to_analyze])
+                    for (entry, tracked), metadata in zip(to_analyze, analyzed):
+                        if metadata:
+                            if self._is_new_or_modified(metadata, tracked):
+                                pending_metadata.append(metadata)
+                                scan_results["files_updated"] += 1
+                                if len(pending_metadata) >= self.scan_batch_size:
+                                    self._save_file_metadata_batch(pending_metadata)
+                                    pending_metadata = []
+                            scan_results["files_discovered"] += 1
+                
+                if pending_metadata:
+                    self._save_file_metadata_batch(pending_metadata)
+            finally:
+                if drop_indexes:
+                    self._create_bulk_indexes()
             
             # 삭제된 파일 확인
-            existing_files = self._get_all_tracked_files()
-            deleted_files = set(existing_files) - current_files
+            deleted_files = tracked_files.keys() - current_files
+            
+            self._mark_files_deleted(deleted_files)
+            scan_results["files_deleted"] = len(deleted_files)
             
-            for deleted_file in deleted_files:
-                self._mark_file_deleted(deleted_file)
-                scan_results["files_deleted"] += 1
+            # 대량 변경 후 쿼리 플래너가 새 인덱스를 고르도록 통계 갱신
+            if scan_results["files_updated"] or deleted_files:
+                with self._write_lock:
+                    self._conn().execute("ANALYZE file_metadata")
             
             # 파일 간 관계 분석
             relationships_found = self._analyze_file_relationships(current_files)
             scan_results["relationships_found"] = relationships_found
             
+            # 스캔 중 쓰기가 많았던 나머지 테이블(관계/태그 등)의 통계는 필요할 때만 갱신
+            with self._write_lock:
+                self._conn().execute("PRAGMA optimize")
+            
             # 스캔 완료 시간 업데이트
             self.last_scan_time = start_time
             
@@ -349,13 +729,22 @@ class SmartFileDiscoverySystem:
         """지능적 파일 검색"""
         
         # SQL 쿼리 구성
-        sql = "SELECT * FROM file_metadata WHERE file_status != 'deleted'"
+        sql = f"SELECT {_FILE_METADATA_COLUMNS} FROM file_metadata WHERE file_status != 'deleted'"
         params = []
         
-        # 키워드 검색
+        # 키워드 검색 (trigram 인덱스는 3글자 이상만 검색 가능하므로 짧은 키워드는 LIKE)
         if query.keywords:
             keyword_conditions = []
+            fts_keywords = [keyword for keyword in query.keywords
+                            if self._fts_enabled and len(keyword) >= 3]
+            if fts_keywords:
+                keyword_conditions.append(
+                    "rowid IN (SELECT rowid FROM file_metadata_fts WHERE file_metadata_fts MATCH ?)"
+                )
+                params.append(' OR '.join('"' + keyword.replace('"', '""') + '"' for keyword in fts_keywords))
             for keyword in query.keywords:
+                if keyword in fts_keywords:
+                    continue
                 keyword_conditions.append("(file_name LIKE ? OR purpose LIKE ? OR tags LIKE ?)")
                 params.extend([f'%{keyword}%', f'%{keyword}%', f'%{keyword}%'])
             sql += f" AND ({' OR '.join(keyword_conditions)})"
@@ -398,42 +787,47 @@ class SmartFileDiscoverySystem:
             sql += " AND access_pattern = ?"
             params.append(query.access_pattern.value)
         
-        # 태그 필터
+        # 태그 필터 (모든 태그를 가진 파일만)
         if query.tags:
-            for tag in query.tags:
-                sql += " AND tags LIKE ?"
-                params.append(f'%"{tag}"%')
+            tags = list(dict.fromkeys(query.tags))
+            tag_placeholders = ','.join(['?' for _ in tags])
+            sql += (f" AND file_path IN (SELECT file_path FROM file_tags WHERE tag IN ({tag_placeholders})"
+                    " GROUP BY file_path HAVING COUNT(*) = ?)")
+            params.extend(tags)
+            params.append(len(tags))
         
         # 정렬
         sql += " ORDER BY quality_score DESC, modified_at DESC"
         
-        # 제한
-        if query.limit:
+        # 제한 (후처리 필터가 있으면 SQL 대신 결과 수집 중에 적용)
+        exclude_re = self._compile_patterns(query.exclude_patterns) if query.exclude_patterns else None
+        content_re = _compile_content_regex(query.content_regex) if query.content_regex else None
+        if query.limit and not (exclude_re or content_re):
             sql += " LIMIT ?"
             params.append(query.limit)
         
-        # 쿼리 실행
-        with sqlite3.connect(self.metadata_db) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(sql, params)
-            rows = cursor.fetchall()
+        # 쿼리 실행 (행을 순차적으로 읽으며 limit을 채우면 중단, sqlite3.Row 대신 튜플로 받음)
+        cursor = self._conn().cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
         
-        # FileMetadata 객체로 변환
         results = []
-        for row in rows:
-            metadata = self._row_to_file_metadata(row)
+        for row in cursor:
+            # 제외 패턴 확인 (row[0]: file_path)
+            if exclude_re and exclude_re.match(row[0]):
+                continue
             
-            # 컨텐츠 정규식 필터 (파일이 존재하는 경우)
-            if query.content_regex and Path(metadata.file_path).exists():
-                if not self._content_matches_regex(metadata.file_path, query.content_regex):
+            # 컨텐츠 정규식 필터 (row[4]: size_bytes)
+            if content_re:
+                if row[4] > self.max_regex_scan_bytes:
                     continue
-            
-            # 제외 패턴 확인
-            if query.exclude_patterns:
-                if any(fnmatch.fnmatch(metadata.file_path, pattern) for pattern in query.exclude_patterns):
+                if not self._content_matches_regex(row[0], content_re):
                     continue
             
-            results.append(metadata)
+            # FileMetadata 객체로 변환
+            results.append(self._row_to_file_metadata(row))
+            if query.limit and len(results) >= query.limit:
+                break
         
         return results
     
@@ -457,159 +851,158 @@ class SmartFileDiscoverySystem:
         
         candidates = self.smart_search(base_query)
         
-        # 관련성 점수 계산
-        scored_files = []
-        for file_metadata in candidates:
-            relevance_score = self._calculate_file_relevance(current_task, file_metadata)
-            scored_files.append((file_metadata, relevance_score))
-        
-        # 점수 기준 정렬
-        scored_files.sort(key=lambda x: x[1], reverse=True)
+        # 관련성 점수 계산 (작업 키워드는 후보마다 다시 추출하지 않고 한 번만 계산)
+        task_keywords = set(keywords)
+        scored_files = [
+            (file_metadata, self._calculate_file_relevance(task_keywords, file_metadata))
+            for file_metadata in candidates
+        ]
         
-        return scored_files[:max_suggestions]
+        # 점수 기준 상위 N개 (전체 정렬 없이)
+        return heapq.nlargest(max_suggestions, scored_files, key=lambda x: x[1])
     
     def get_file_dependencies(self, file_path: str) -> List[FileRelationship]:
         """파일 의존성 조회"""
         
-        with sqlite3.connect(self.metadata_db) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT * FROM file_relationships 
-                WHERE from_file = ? OR to_file = ?
-                ORDER BY strength DESC
-            ''', (file_path, file_path))
-            
-            relationships = []
-            for row in cursor.fetchall():
-                relationships.append(FileRelationship(
-                    from_file=row['from_file'],
-                    to_file=row['to_file'],
-                    relationship_type=row['relationship_type'],
-                    strength=row['strength'],
-                    discovered_at=datetime.fromisoformat(row['discovered_at'])
-                ))
+        conn = self._conn()
+        cursor = conn.execute('''
+            SELECT * FROM file_relationships 
+            WHERE from_file = ? OR to_file = ?
+            ORDER BY strength DESC
+        ''', (file_path, file_path))
+        
+        relationships = []
+        for row in cursor.fetchall():
+            relationships.append(FileRelationship(
+                from_file=row['from_file'],
+                to_file=row['to_file'],
+                relationship_type=row['relationship_type'],
+                strength=row['strength'],
+                discovered_at=datetime.fromisoformat(row['discovered_at'])
+            ))
         
         return relationships
     
     def track_file_access(self, file_path: str, accessed_by: str, access_type: str = "read"):
-        """파일 접근 추적"""
-        
-        # 접근 로그 저장
-        with sqlite3.connect(self.metadata_db) as conn:
-            conn.execute('''
-                INSERT INTO access_log (file_path, accessed_by, access_type, accessed_at)
-                VALUES (?, ?, ?, ?)
-            ''', (file_path, accessed_by, access_type, datetime.now().isoformat()))
-            
-            # 파일 메타데이터 업데이트
-            conn.execute('''
-                UPDATE file_metadata 
-                SET access_count = access_count + 1,
-                    last_accessed = ?
-                WHERE file_path = ?
-            ''', (datetime.now().isoformat(), file_path))
-        
-        # 접근 패턴 업데이트
-        self._update_access_pattern(file_path)
+        """파일 접근 추적 (저장은 백그라운드 스레드가 일괄 처리)"""
+        self._access_queue.put((file_path, accessed_by, access_type, datetime.now().isoformat()))
     
     def get_project_file_overview(self) -> Dict[str, Any]:
         """프로젝트 파일 개요"""
         
-        with sqlite3.connect(self.metadata_db) as conn:
-            # 전체 통계
-            total_files = conn.execute("SELECT COUNT(*) FROM file_metadata WHERE file_status != 'deleted'").fetchone()[0]
-            
-            # 타입별 분포
-            type_distribution = {}
-            cursor = conn.execute('''
-                SELECT file_type, COUNT(*) as count 
-                FROM file_metadata 
-                WHERE file_status != 'deleted'
-                GROUP BY file_type
-            ''')
-            for row in cursor.fetchall():
-                type_distribution[row[0]] = row[1]
-            
-            # 역할별 분포
-            role_distribution = {}
-            cursor = conn.execute('''
-                SELECT role_ownership, COUNT(*) as count 
-                FROM file_metadata 
-                WHERE file_status != 'deleted' AND role_ownership IS NOT NULL
-                GROUP BY role_ownership
-            ''')
-            for row in cursor.fetchall():
-                role_distribution[row[0]] = row[1]
-            
-            # 품질 분포
-            quality_stats = conn.execute('''
-                SELECT 
-                    AVG(quality_score) as avg_quality,
-                    MIN(quality_score) as min_quality,
-                    MAX(quality_score) as max_quality
-                FROM file_metadata 
-                WHERE file_status != 'deleted'
-            ''').fetchone()
-            
-            # 최근 활동
-            recent_files = conn.execute('''
-                SELECT file_path, modified_at 
-                FROM file_metadata 
-                WHERE file_status != 'deleted'
-                ORDER BY modified_at DESC 
-                LIMIT 10
-            ''').fetchall()
+        conn = self._conn()
+        # 전체/타입별/역할별/접근 패턴별 통계와 품질 분포를 한 번의 (인덱스 전용) 집계로 계산
+        total_files = 0
+        type_distribution = {}
+        role_distribution = {}
+        access_patterns = {}
+        quality_sum = 0.0
+        quality_count = 0
+        min_quality = None
+        max_quality = None
+        cursor = conn.execute('''
+            SELECT file_type, role_ownership, access_pattern, COUNT(*) as count,
+                   SUM(quality_score), COUNT(quality_score), MIN(quality_score), MAX(quality_score)
+            FROM file_metadata 
+            WHERE file_status != 'deleted'
+            GROUP BY file_type, role_ownership, access_pattern
+        ''')
+        for (file_type, role_ownership, access_pattern, count,
+             group_sum, group_count, group_min, group_max) in cursor:
+            total_files += count
+            type_distribution[file_type] = type_distribution.get(file_type, 0) + count
+            if role_ownership is not None:
+                role_distribution[role_ownership] = role_distribution.get(role_ownership, 0) + count
+            access_patterns[access_pattern] = access_patterns.get(access_pattern, 0) + count
             
-            # 접근 패턴
-            access_patterns = {}
-            cursor = conn.execute('''
-                SELECT access_pattern, COUNT(*) as count 
-                FROM file_metadata 
-                WHERE file_status != 'deleted'
-                GROUP BY access_pattern
-            ''')
-            for row in cursor.fetchall():
-                access_patterns[row[0]] = row[1]
+            if group_sum is not None:
+                quality_sum += group_sum
+                quality_count += group_count
+                min_quality = group_min if min_quality is None else min(min_quality, group_min)
+                max_quality = group_max if max_quality is None else max(max_quality, group_max)
+        
+        # 최근 활동
+        recent_files = conn.execute('''
+            SELECT file_path, modified_at 
+            FROM file_metadata 
+            WHERE file_status != 'deleted'
+            ORDER BY modified_at DESC 
+            LIMIT 10
+        ''').fetchall()
         
         return {
             'total_files': total_files,
-            'type_distribution': type_distribution,
-            'role_distribution': role_distribution,
+            'type_distribution': dict(sorted(type_distribution.items())),
+            'role_distribution': dict(sorted(role_distribution.items())),
             'quality_statistics': {
-                'average_quality': quality_stats[0] or 0.0,
-                'min_quality': quality_stats[1] or 0.0,
-                'max_quality': quality_stats[2] or 0.0
+                'average_quality': quality_sum / quality_count if quality_count else 0.0,
+                'min_quality': min_quality or 0.0,
+                'max_quality': max_quality or 0.0
             },
             'recent_activity': [
                 {'file_path': row[0], 'modified_at': row[1]}
                 for row in recent_files
             ],
-            'access_patterns': access_patterns,
+            'access_patterns': dict(sorted(access_patterns.items())),
             'last_scan': self.last_scan_time.isoformat() if self.last_scan_time != datetime.min else None
         }
     
+    def close(self):
+        """파일 감시/모니터링 중지 후 남은 접근 기록을 저장하고 모든 데이터베이스 연결 종료"""
+        self.scan_active = False
+        self._file_change_event.set()
+        if self.file_observer is not None:
+            self.file_observer.stop()
+        
+        # 접근 기록 스레드는 종료 신호(None) 전까지 큐에 쌓인 기록을 모두 저장하고 끝남
+        self._access_queue.put(None)
+        for thread in (self.access_writer_thread, self.monitor_thread):
+            if thread.is_alive() and thread is not threading.current_thread():
+                thread.join(timeout=5)
+        
+        with self._write_lock:
+            connections, self._connections = self._connections, []
+            for conn in connections:
+                conn.close()
+            self._tls = threading.local()
+    
     # Helper methods
     def _scan_directory(self, directory: Path):
-        """디렉토리 재귀 스캔"""
-        for item in directory.rglob('*'):
-            if item.is_file():
-                yield item
+        """디렉토리 재귀 스캔 (제외 디렉토리와 메타데이터 DB 디렉토리는 내려가지 않음)
+        
+        stat 결과를 캐시하는 os.DirEntry를 그대로 넘겨 분석 단계의 중복 stat 호출을 없앰
+        """
+        discovery_path = str(self.discovery_dir)
+        pending = [str(directory)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path != discovery_path and not self._exclude_dir_re.match(entry.name):
+                                pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
     
-    def _should_exclude_file(self, file_path: Path) -> bool:
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> re.Pattern:
+        """fnmatch 패턴 목록을 하나의 정규식으로 컴파일"""
+        return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns) or r"(?!)")
+    
+    def _should_exclude_file(self, file_path: Union[Path, os.DirEntry]) -> bool:
         """파일 제외 여부 확인"""
-        file_str = str(file_path)
-        return any(fnmatch.fnmatch(file_str, pattern) for pattern in self.detection_rules['exclude_patterns'])
+        return self._exclude_re.match(file_path.name) is not None
     
-    def _analyze_file(self, file_path: Path) -> Optional[FileMetadata]:
-        """파일 분석"""
+    def _analyze_file(self, entry: Union[os.DirEntry, Path]) -> Optional[FileMetadata]:
+        """파일 분석 (스캔에서 받은 DirEntry의 stat 결과 재사용)"""
+        file_path = Path(entry)
         try:
-            if not file_path.exists():
-                return None
-            
-            stat = file_path.stat()
+            stat = entry.stat()
             
             # 기본 정보
-            file_name = file_path.name
+            file_name = entry.name
             size_bytes = stat.st_size
             created_at = datetime.fromtimestamp(stat.st_ctime)
             modified_at = datetime.fromtimestamp(stat.st_mtime)
@@ -621,8 +1014,7 @@ class SmartFileDiscoverySystem:
             content_hash = self._calculate_file_hash(file_path)
             
             # MIME 타입
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            mime_type = mime_type or 'application/octet-stream'
+            mime_type = _guess_mime_type(file_name)
             
             # 언어 감지
             language = self._detect_language(file_path)
@@ -645,14 +1037,17 @@ class SmartFileDiscoverySystem:
             # 프로젝트 단계 추론
             project_phase = self._infer_project_phase(file_path, file_type)
             
+            # 점수 계산용 소스 코드 (세 점수가 같은 내용을 쓰므로 한 번만 읽고 소문자 변환)
+            content = self._read_source_content(file_path) if file_type == FileType.SOURCE_CODE else None
+            
             # 품질 점수 계산
-            quality_score = self._calculate_quality_score(file_path, file_type)
+            quality_score = self._calculate_quality_score(content)
             
             # 복잡도 점수 계산
-            complexity_score = self._calculate_complexity_score(file_path, file_type)
+            complexity_score = self._calculate_complexity_score(content)
             
             # 유지보수성 점수 계산
-            maintainability_score = self._calculate_maintainability_score(file_path, file_type)
+            maintainability_score = self._calculate_maintainability_score(content)
             
             return FileMetadata(
                 file_path=str(file_path),
@@ -687,19 +1082,32 @@ class SmartFileDiscoverySystem:
     def _detect_file_type(self, file_path: Path) -> FileType:
         """파일 타입 감지"""
         file_str = str(file_path).lower()
+        _, dot, suffix = file_str.rpartition('.')
+        suffix_type = self._file_type_by_suffix.get(suffix) if dot and '/' not in suffix else None
         
-        for file_type, patterns in self.detection_rules['file_type_patterns'].items():
-            if any(fnmatch.fnmatch(file_str, pattern.lower()) for pattern in patterns):
+        # 확장자로 정해진 타입보다 우선순위가 높은 타입의 나머지 패턴만 확인
+        for file_type, pattern_re in self._file_type_res.items():
+            if file_type is suffix_type:
+                return file_type
+            if pattern_re is not None and pattern_re.match(file_str):
                 return file_type
         
         return FileType.UNKNOWN
     
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """파일 해시 계산"""
+        """파일 해시 계산 (blake3 또는 sha256 hex, 파일 전체를 메모리에 올리지 않음)"""
         try:
+            if blake3 is not None:
+                return blake3.blake3().update_mmap(file_path).hexdigest()
+            
             with open(file_path, 'rb') as f:
-                content = f.read()
-                return hashlib.md5(content).hexdigest()
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+                return digest.hexdigest()
         except:
             return ""
     
@@ -721,27 +1129,23 @@ class SmartFileDiscoverySystem:
     
     def _extract_dependencies(self, file_path: Path) -> List[str]:
         """의존성 추출"""
-        dependencies = []
+        if file_path.suffix.lower() != '.py':
+            return []
+        
+        dependencies = set()
         
         try:
-            if file_path.suffix.lower() == '.py':
-                # Python import 분석
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                import_patterns = [
-                    r'import\s+([a-zA-Z_][a-zA-Z0-9_]*)',
-                    r'from\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+import'
-                ]
+            # Python import 분석
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            
+            for match in _PY_IMPORT_RE.finditer(content):
+                dependencies.add(match.group(1) or match.group(2))
                 
-                for pattern in import_patterns:
-                    matches = re.findall(pattern, content)
-                    dependencies.extend(matches)
-                    
         except Exception:
             pass
         
-        return list(set(dependencies))
+        return list(dependencies)
     
     def _generate_file_tags(self, file_path: Path, file_type: FileType) -> List[str]:
         """파일 태그 생성"""
@@ -774,43 +1178,13 @@ class SmartFileDiscoverySystem:
     
     def _infer_file_purpose(self, file_path: Path, file_type: FileType) -> Optional[str]:
         """파일 목적 추론"""
-        file_name = file_path.name.lower()
-        
-        purpose_mapping = {
-            'main': '메인 진입점',
-            'index': '인덱스 파일',
-            'config': '설정 파일',
-            'test': '테스트 파일',
-            'util': '유틸리티 함수',
-            'helper': '헬퍼 함수',
-            'model': '데이터 모델',
-            'view': '뷰 컴포넌트',
-            'controller': '컨트롤러',
-            'service': '서비스 로직',
-            'api': 'API 인터페이스',
-            'component': 'UI 컴포넌트'
-        }
-        
-        for keyword, purpose in purpose_mapping.items():
-            if keyword in file_name:
-                return purpose
-        
-        return None
+        return _infer_purpose_from_name(file_path.name.lower())
     
     def _infer_role_ownership(self, file_path: Path) -> Optional[str]:
         """역할 소유권 추론"""
         path_str = str(file_path).lower()
         
-        role_indicators = {
-            'frontend': ['frontend', 'ui', 'component', 'view', 'css', 'html'],
-            'backend': ['backend', 'api', 'server', 'service', 'model'],
-            'qa_tester': ['test', 'spec', 'testing'],
-            'devops': ['deploy', 'docker', 'kubernetes', 'ci', 'cd'],
-            'database_designer': ['migration', 'schema', 'database', 'sql'],
-            'business_analyst': ['requirement', 'spec', 'business']
-        }
-        
-        for role, indicators in role_indicators.items():
+        for role, indicators in _ROLE_INDICATORS.items():
             if any(indicator in path_str for indicator in indicators):
                 return role
         
@@ -831,98 +1205,112 @@ class SmartFileDiscoverySystem:
         
         return None
     
-    def _calculate_quality_score(self, file_path: Path, file_type: FileType) -> float:
-        """품질 점수 계산"""
-        score = 0.5  # 기본 점수
-        
+    def _read_source_content(self, file_path: Path) -> Optional[bytes]:
+        """점수 계산용 소스 코드 내용 (ASCII 소문자 bytes - 키워드가 ASCII라 디코딩 생략, 읽기 실패 시 None)"""
         try:
-            if file_type == FileType.SOURCE_CODE and file_path.exists():
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                # 문서화 체크
-                if '"""' in content or '/*' in content or '//' in content:
-                    score += 0.2
-                
-                # 테스트 관련 체크
-                if any(keyword in content.lower() for keyword in ['test', 'assert', 'expect']):
-                    score += 0.1
-                
-                # 에러 처리 체크
-                if any(keyword in content.lower() for keyword in ['try', 'catch', 'except', 'error']):
-                    score += 0.1
-                
+            with open(file_path, 'rb') as f:
+                return f.read().lower()
         except Exception:
-            pass
+            return None
+    
+    def _calculate_quality_score(self, content: Optional[bytes]) -> float:
+        """품질 점수 계산 (content: 소문자 소스 코드 bytes, 소스 코드가 아니면 None)"""
+        score = 0.5  # 기본 점수
+        
+        if content is not None:
+            # 문서화 체크
+            if b'"""' in content or b'/*' in content or b'//' in content:
+                score += 0.2
+            
+            # 테스트 관련 체크
+            if any(keyword in content for keyword in [b'test', b'assert', b'expect']):
+                score += 0.1
+            
+            # 에러 처리 체크
+            if any(keyword in content for keyword in [b'try', b'catch', b'except', b'error']):
+                score += 0.1
         
         return min(1.0, score)
     
-    def _calculate_complexity_score(self, file_path: Path, file_type: FileType) -> float:
-        """복잡도 점수 계산"""
-        if file_type != FileType.SOURCE_CODE or not file_path.exists():
+    def _calculate_complexity_score(self, content: Optional[bytes]) -> float:
+        """복잡도 점수 계산 (content: 소문자 소스 코드 bytes, 소스 코드가 아니면 None)"""
+        if content is None:
             return 0.5
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-            # 복잡도 지표 카운트
-            complexity_keywords = self.detection_rules['quality_indicators']['complexity_keywords']
-            complexity_count = sum(content.lower().count(keyword) for keyword in complexity_keywords)
-            
-            # 라인 수 기반 정규화
-            line_count = len(content.split('\n'))
-            if line_count > 0:
-                complexity_ratio = complexity_count / line_count
-                return min(1.0, complexity_ratio * 10)  # 스케일링
-            
-        except Exception:
-            pass
+        # 복잡도 지표 카운트 (str.count는 C 루프로 처리)
+        complexity_keywords = self.detection_rules['quality_indicators']['complexity_keywords']
+        complexity_count = sum(content.count(keyword.encode('utf-8')) for keyword in complexity_keywords)
         
-        return 0.5
+        # 라인 수 기반 정규화
+        line_count = content.count(b'\n') + 1
+        complexity_ratio = complexity_count / line_count
+        return min(1.0, complexity_ratio * 10)  # 스케일링
     
-    def _calculate_maintainability_score(self, file_path: Path, file_type: FileType) -> float:
-        """유지보수성 점수 계산"""
-        if file_type != FileType.SOURCE_CODE or not file_path.exists():
+    def _calculate_maintainability_score(self, content: Optional[bytes]) -> float:
+        """유지보수성 점수 계산 (content: 소문자 소스 코드 bytes, 소스 코드가 아니면 None)"""
+        if content is None:
             return 0.5
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-            score = 0.5
-            
-            # 구조화 지표
-            maintainability_keywords = self.detection_rules['quality_indicators']['maintainability_keywords']
-            structure_count = sum(content.lower().count(keyword) for keyword in maintainability_keywords)
-            
-            if structure_count > 0:
-                score += 0.2
-            
-            # 주석 비율
-            comment_lines = len([line for line in content.split('\n') if line.strip().startswith(('#', '//', '/*'))])
-            total_lines = len(content.split('\n'))
-            
-            if total_lines > 0:
-                comment_ratio = comment_lines / total_lines
-                score += min(0.3, comment_ratio * 2)
-            
-            return min(1.0, score)
-            
-        except Exception:
-            pass
+        score = 0.5
+        
+        # 구조화 지표
+        maintainability_keywords = self.detection_rules['quality_indicators']['maintainability_keywords']
+        if any(keyword.encode('utf-8') in content for keyword in maintainability_keywords):
+            score += 0.2
         
-        return 0.5
+        # 주석 비율 (줄 목록을 만들지 않고 한 번의 정규식 스캔으로 계산)
+        line_count = content.count(b'\n') + 1
+        comment_lines = sum(1 for _ in _COMMENT_LINE_RE.finditer(content))
+        comment_ratio = comment_lines / line_count
+        score += min(0.3, comment_ratio * 2)
+        
+        return min(1.0, score)
+    
+    def _start_file_observer(self):
+        """프로젝트 디렉토리 파일 이벤트 감시 시작 (watchdog 미설치 시 주기적 재스캔)"""
+        if Observer is None:
+            return
+        
+        try:
+            observer = Observer()
+            observer.schedule(_ProjectFileHandler(self._on_file_change),
+                              str(self.project_root), recursive=True)
+            observer.daemon = True
+            observer.start()
+            self.file_observer = observer
+        except Exception as e:
+            print(f"⚠️ 파일 감시 시작 실패, 주기적 재스캔으로 대체: {str(e)}")
+    
+    def _on_file_change(self, path: str, deleted: bool):
+        """파일 변경 알림 (감시 스레드에서 호출, 같은 경로는 마지막 상태만 유지)"""
+        with self._file_change_lock:
+            self._pending_file_changes[path] = deleted
+        self._file_change_event.set()
     
     def _monitor_file_changes(self):
         """파일 변경 모니터링"""
         while self.scan_active:
             try:
-                # 간단한 구현 - 실제로는 파일 시스템 이벤트 모니터링 사용 권장
-                time.sleep(300)  # 5분마다 체크
+                if self.file_observer is None:
+                    # close() 시 즉시 깨어나도록 이벤트로 대기
+                    self._file_change_event.wait(timeout=self.file_poll_interval)
+                    self._file_change_event.clear()
+                    if self.scan_active:
+                        self._scan_modified_files()
+                    continue
+                
+                # 이벤트가 오면 잠시 모아서 (git checkout 등 연속 변경) 한 번에 반영
+                if self._file_change_event.wait(timeout=self.file_poll_interval):
+                    if not self.scan_active:
+                        break
+                    time.sleep(self.file_change_debounce)
+                    self._file_change_event.clear()
+                    self._scan_modified_files()
                 
-                # 변경된 파일만 다시 스캔
-                self._scan_modified_files()
+                # 누락된 이벤트 대비 주기적 전체 재스캔
+                if (self.last_scan_time != datetime.min and
+                        datetime.now() - self.last_scan_time >= self.full_rescan_interval):
+                    self.scan_project_files(force_rescan=True)
                 
             except Exception as e:
                 print(f"파일 모니터링 오류: {str(e)}")
@@ -930,196 +1318,343 @@ class SmartFileDiscoverySystem:
     
     def _scan_modified_files(self):
         """수정된 파일만 스캔"""
-        # 최근 스캔 이후 수정된 파일들만 다시 분석
-        pass  # 실제 구현에서는 파일 시스템 변경 감지 구현
-    
-    def _is_new_or_modified(self, metadata: FileMetadata) -> bool:
-        """새 파일이거나 수정된 파일인지 확인"""
-        with sqlite3.connect(self.metadata_db) as conn:
-            cursor = conn.execute(
-                "SELECT content_hash, modified_at FROM file_metadata WHERE file_path = ?",
-                (metadata.file_path,)
-            )
-            row = cursor.fetchone()
+        with self._file_change_lock:
+            changes, self._pending_file_changes = self._pending_file_changes, {}
+        
+        # 최초 전체 스캔 전의 변경은 전체 스캔에 반영되므로 무시
+        if self.last_scan_time == datetime.min:
+            return
+        
+        if self.file_observer is None:
+            # 이벤트 감시가 없으면 재스캔 (수정 시간/크기가 같은 파일은 분석 생략)
+            self.scan_project_files()
+            return
+        
+        changed_metadata = []
+        deleted_paths = []
+        for path, deleted in changes.items():
+            if self._is_ignored_path(path):
+                continue
             
-            if not row:
-                return True  # 새 파일
+            if deleted or not os.path.exists(path):
+                deleted_paths.append(path)
+                continue
             
-            # 해시나 수정 시간이 다르면 수정된 파일
-            return (row[0] != metadata.content_hash or 
-                   row[1] != metadata.modified_at.isoformat())
+            # 새로 생기거나 옮겨 온 디렉토리는 하위 파일 전체 분석
+            if os.path.isdir(path):
+                if self._exclude_dir_re.match(os.path.basename(path)):
+                    continue
+                entries = self._scan_directory(Path(path))
+            else:
+                entries = [Path(path)]
+            for entry in entries:
+                if self._should_exclude_file(entry):
+                    continue
+                metadata = self._analyze_file(entry)
+                if metadata:
+                    changed_metadata.append(metadata)
+        
+        if changed_metadata:
+            self._save_file_metadata_batch(changed_metadata)
+        
+        if deleted_paths:
+            # 디렉토리 삭제 시 그 아래 추적 중인 파일도 함께 삭제 처리
+            deleted_set = set(deleted_paths)
+            prefixes = tuple(path.rstrip(os.sep) + os.sep for path in deleted_paths)
+            self._mark_files_deleted([
+                file_path for file_path in self._get_tracked_file_signatures()
+                if file_path in deleted_set or file_path.startswith(prefixes)
+            ])
+    
+    def _is_ignored_path(self, path: str) -> bool:
+        """감시 이벤트 경로가 메타데이터 DB 디렉토리나 제외 디렉토리 아래인지 확인"""
+        try:
+            parts = Path(path).relative_to(self.project_root).parts
+        except ValueError:
+            return True
+        
+        if not parts or parts[0] == self.discovery_dir.name:
+            return True
+        return any(self._exclude_dir_re.match(part) for part in parts[:-1])
+    
+    def _is_new_or_modified(self, metadata: FileMetadata, tracked: Optional[tuple]) -> bool:
+        """새 파일이거나 수정된 파일인지 확인 (tracked: 이전 스캔의 (modified_at, size_bytes, content_hash))"""
+        if tracked is None:
+            return True  # 새 파일
+        
+        # 해시나 수정 시간이 다르면 수정된 파일
+        return (tracked[2] != metadata.content_hash or 
+               tracked[0] != metadata.modified_at.isoformat())
+    
+    def _get_tracked_file_signatures(self) -> Dict[str, tuple]:
+        """추적 중인 파일별 (modified_at, size_bytes, content_hash) 일괄 조회"""
+        cursor = self._conn().execute(
+            "SELECT file_path, modified_at, size_bytes, content_hash FROM file_metadata "
+            "WHERE file_status != 'deleted'"
+        )
+        return {row[0]: (row[1], row[2], row[3]) for row in cursor}
+    
+    def _drop_bulk_indexes(self):
+        """대량 쓰기 전 보조 인덱스 삭제 (행마다 인덱스를 갱신하지 않도록)"""
+        with self._transaction() as conn:
+            for index_name in _BULK_DROPPABLE_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+    
+    def _create_bulk_indexes(self):
+        """대량 쓰기 후 보조 인덱스 재생성"""
+        with self._transaction() as conn:
+            for create_sql in _BULK_DROPPABLE_INDEXES.values():
+                conn.execute(create_sql)
     
     def _save_file_metadata(self, metadata: FileMetadata):
         """파일 메타데이터 저장"""
-        with sqlite3.connect(self.metadata_db) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO file_metadata 
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                metadata.file_path, metadata.file_name, metadata.file_type.value,
-                metadata.file_status.value, metadata.size_bytes,
-                metadata.created_at.isoformat(), metadata.modified_at.isoformat(),
-                metadata.last_accessed.isoformat() if metadata.last_accessed else None,
-                metadata.access_count, metadata.access_pattern.value,
-                metadata.content_hash, metadata.mime_type, metadata.encoding,
-                metadata.language, metadata.framework,
-                json.dumps(metadata.dependencies), json.dumps(metadata.tags),
-                metadata.purpose, metadata.role_ownership, metadata.project_phase,
-                metadata.quality_score, metadata.complexity_score,
-                metadata.maintainability_score,
-                datetime.now().isoformat(), datetime.now().isoformat()
-            ))
+        self._save_file_metadata_batch([metadata])
+    
+    def _save_file_metadata_batch(self, metadata_list: List[FileMetadata]):
+        """메타데이터 일괄 저장 (태그 인덱스 테이블 포함, 단일 트랜잭션)"""
+        now = datetime.now().isoformat()
+        with self._transaction() as conn:
+            conn.executemany(_FILE_METADATA_UPSERT_SQL,
+                             [self._metadata_to_row(metadata, now) for metadata in metadata_list])
+            
+            conn.executemany("DELETE FROM file_tags WHERE file_path = ?",
+                             [(metadata.file_path,) for metadata in metadata_list])
+            conn.executemany("INSERT OR IGNORE INTO file_tags (file_path, tag) VALUES (?, ?)",
+                             [(metadata.file_path, tag)
+                              for metadata in metadata_list for tag in metadata.tags])
+    
+    def _metadata_to_row(self, metadata: FileMetadata, now: str) -> tuple:
+        """FileMetadata를 _FILE_METADATA_UPSERT_SQL 파라미터로 변환 (asdict 없이 컬럼 순서대로 직접 구성)"""
+        return (
+            metadata.file_path, metadata.file_name, metadata.file_type.value,
+            metadata.file_status.value, metadata.size_bytes,
+            metadata.created_at.isoformat(), metadata.modified_at.isoformat(),
+            metadata.last_accessed.isoformat() if metadata.last_accessed else None,
+            metadata.access_count, metadata.access_pattern.value,
+            metadata.content_hash, metadata.mime_type, metadata.encoding,
+            metadata.language, metadata.framework,
+            _dumps_list(metadata.dependencies), _dumps_list(metadata.tags),
+            metadata.purpose, metadata.role_ownership, metadata.project_phase,
+            metadata.quality_score, metadata.complexity_score,
+            metadata.maintainability_score,
+            now, now
+        )
     
     def _get_all_tracked_files(self) -> List[str]:
         """추적 중인 모든 파일 목록"""
-        with sqlite3.connect(self.metadata_db) as conn:
-            cursor = conn.execute("SELECT file_path FROM file_metadata WHERE file_status != 'deleted'")
-            return [row[0] for row in cursor.fetchall()]
+        conn = self._conn()
+        cursor = conn.execute("SELECT file_path FROM file_metadata WHERE file_status != 'deleted'")
+        return [row[0] for row in cursor.fetchall()]
     
     def _mark_file_deleted(self, file_path: str):
         """파일을 삭제됨으로 표시"""
-        with sqlite3.connect(self.metadata_db) as conn:
-            conn.execute(
+        self._mark_files_deleted([file_path])
+    
+    def _mark_files_deleted(self, file_paths):
+        """여러 파일을 한 트랜잭션에서 삭제됨으로 표시"""
+        if not file_paths:
+            return
+        
+        now = datetime.now().isoformat()
+        with self._transaction() as conn:
+            conn.executemany(
                 "UPDATE file_metadata SET file_status = 'deleted', updated_at = ? WHERE file_path = ?",
-                (datetime.now().isoformat(), file_path)
+                [(now, file_path) for file_path in file_paths]
             )
     
     def _analyze_file_relationships(self, current_files: set) -> int:
         """파일 간 관계 분석"""
         # 간단한 구현 - 실제로는 더 정교한 의존성 분석 필요
-        relationships_found = 0
+        relationships = []
         
-        # Python import 분석 예시
-        for file_path in current_files:
-            if file_path.endswith('.py'):
-                try:
-                    relationships = self._analyze_python_imports(file_path)
-                    for relationship in relationships:
-                        self._save_file_relationship(relationship)
-                        relationships_found += 1
-                except Exception:
-                    pass
+        # Python import 분석 예시 (파일별 분석은 독립적이므로 스캔과 같은 스레드 풀로 병렬 처리)
+        python_files = [file_path for file_path in current_files if file_path.endswith('.py')]
+        if python_files:
+            module_index = self._build_module_index(python_files)
+            with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+                for file_relationships in pool.map(self._analyze_python_imports, python_files,
+                                                   [module_index] * len(python_files)):
+                    relationships.extend(file_relationships)
         
-        return relationships_found
+        # 발견한 관계는 한 트랜잭션으로 저장
+        if relationships:
+            self._save_file_relationships(relationships)
+        
+        return len(relationships)
+    
+    def _build_module_index(self, python_files: List[str]) -> Dict[str, str]:
+        """프로젝트 루트 기준 모듈 이름 -> 파일 경로 맵 (pkg/mod.py -> 'pkg.mod', pkg/__init__.py -> 'pkg')"""
+        module_index = {}
+        for file_path in python_files:
+            try:
+                parts = Path(file_path).relative_to(self.project_root).with_suffix('').parts
+            except ValueError:
+                continue
+            
+            if parts and parts[-1] == '__init__':
+                parts = parts[:-1]
+            if parts:
+                module_index['.'.join(parts)] = file_path
+        
+        return module_index
+    
+    @staticmethod
+    def _resolve_module_file(module: str, module_index: Dict[str, str]) -> Optional[str]:
+        """모듈 이름에 해당하는 프로젝트 파일 (pkg.mod.func처럼 없는 경로는 가장 긴 상위 모듈)"""
+        parts = module.split('.')
+        while parts:
+            file_path = module_index.get('.'.join(parts))
+            if file_path:
+                return file_path
+            parts.pop()
+        return None
     
-    def _analyze_python_imports(self, file_path: str) -> List[FileRelationship]:
-        """Python import 분석"""
+    def _analyze_python_imports(self, file_path: str, module_index: Dict[str, str]) -> List[FileRelationship]:
+        """Python import 분석 (AST로 import 문을 추출해 module_index의 프로젝트 파일과 연결)"""
         relationships = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-            # 간단한 import 패턴 매칭
-            import_patterns = [
-                r'from\s+\.([a-zA-Z_][a-zA-Z0-9_]*)\s+import',
-                r'import\s+\.([a-zA-Z_][a-zA-Z0-9_]*)'
-            ]
-            
-            for pattern in import_patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    # 상대 경로로 파일 찾기
-                    base_dir = Path(file_path).parent
-                    imported_file = base_dir / f"{match}.py"
-                    
-                    if imported_file.exists():
-                        relationship = FileRelationship(
-                            from_file=file_path,
-                            to_file=str(imported_file),
-                            relationship_type="imports",
-                            strength=0.8,
-                            discovered_at=datetime.now()
-                        )
-                        relationships.append(relationship)
-        
+            with open(file_path, 'rb') as f:
+                source = f.read()
+            if b'import' not in source:
+                return relationships
+            tree = ast.parse(source, filename=file_path)
         except Exception:
-            pass
+            return relationships
+        
+        # 상대 import 기준 패키지 (파일이 있는 디렉토리)
+        try:
+            package_parts = Path(file_path).parent.relative_to(self.project_root).parts
+        except ValueError:
+            package_parts = ()
+        
+        imported_files = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imported_files.add(self._resolve_module_file(alias.name, module_index))
+            
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    # from . / from .. 은 파일 디렉토리에서 level - 1 단계 위 패키지 기준
+                    if node.level - 1 > len(package_parts):
+                        continue
+                    base_parts = list(package_parts[:len(package_parts) - (node.level - 1)])
+                    if node.module:
+                        base_parts.append(node.module)
+                    module = '.'.join(base_parts)
+                else:
+                    module = node.module
+                
+                for alias in node.names:
+                    # from pkg import mod 형태는 하위 모듈 파일 우선
+                    imported_file = module_index.get(f"{module}.{alias.name}" if module else alias.name)
+                    if imported_file is None and module:
+                        imported_file = self._resolve_module_file(module, module_index)
+                    imported_files.add(imported_file)
+        
+        imported_files.discard(None)
+        imported_files.discard(file_path)
+        
+        discovered_at = datetime.now()
+        for imported_file in sorted(imported_files):
+            relationships.append(FileRelationship(
+                from_file=file_path,
+                to_file=imported_file,
+                relationship_type="imports",
+                strength=0.8,
+                discovered_at=discovered_at
+            ))
         
         return relationships
     
     def _save_file_relationship(self, relationship: FileRelationship):
         """파일 관계 저장"""
-        with sqlite3.connect(self.metadata_db) as conn:
-            conn.execute('''
+        self._save_file_relationships([relationship])
+    
+    def _save_file_relationships(self, relationships: List[FileRelationship]):
+        """파일 관계 일괄 저장 (단일 트랜잭션)"""
+        with self._transaction() as conn:
+            conn.executemany('''
                 INSERT OR REPLACE INTO file_relationships 
                 (from_file, to_file, relationship_type, strength, discovered_at)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (
+            ''', [(
                 relationship.from_file, relationship.to_file,
                 relationship.relationship_type, relationship.strength,
                 relationship.discovered_at.isoformat()
-            ))
+            ) for relationship in relationships])
     
-    def _row_to_file_metadata(self, row: sqlite3.Row) -> FileMetadata:
-        """데이터베이스 행을 FileMetadata로 변환"""
+    def _row_to_file_metadata(self, row: tuple) -> FileMetadata:
+        """_FILE_METADATA_COLUMNS 순서로 조회한 행을 FileMetadata로 변환"""
+        (file_path, file_name, file_type, file_status, size_bytes, created_at, modified_at,
+         last_accessed, access_count, access_pattern, content_hash, mime_type, encoding,
+         language, framework, dependencies, tags, purpose, role_ownership, project_phase,
+         quality_score, complexity_score, maintainability_score) = row
         return FileMetadata(
-            file_path=row['file_path'],
-            file_name=row['file_name'],
-            file_type=FileType(row['file_type']),
-            file_status=FileStatus(row['file_status']),
-            size_bytes=row['size_bytes'],
-            created_at=datetime.fromisoformat(row['created_at']),
-            modified_at=datetime.fromisoformat(row['modified_at']),
-            last_accessed=datetime.fromisoformat(row['last_accessed']) if row['last_accessed'] else None,
-            access_count=row['access_count'],
-            access_pattern=AccessPattern(row['access_pattern']),
-            content_hash=row['content_hash'],
-            mime_type=row['mime_type'],
-            encoding=row['encoding'],
-            language=row['language'],
-            framework=row['framework'],
-            dependencies=json.loads(row['dependencies']) if row['dependencies'] else [],
-            tags=json.loads(row['tags']) if row['tags'] else [],
-            purpose=row['purpose'],
-            role_ownership=row['role_ownership'],
-            project_phase=row['project_phase'],
-            quality_score=row['quality_score'],
-            complexity_score=row['complexity_score'],
-            maintainability_score=row['maintainability_score']
+            file_path=file_path,
+            file_name=file_name,
+            file_type=_FILE_TYPE_BY_VALUE[file_type],
+            file_status=_FILE_STATUS_BY_VALUE[file_status],
+            size_bytes=size_bytes,
+            created_at=datetime.fromisoformat(created_at),
+            modified_at=datetime.fromisoformat(modified_at),
+            last_accessed=datetime.fromisoformat(last_accessed) if last_accessed else None,
+            access_count=access_count,
+            access_pattern=_ACCESS_PATTERN_BY_VALUE[access_pattern],
+            content_hash=content_hash,
+            mime_type=mime_type,
+            encoding=encoding,
+            language=language,
+            framework=framework,
+            dependencies=_loads_list(dependencies),
+            tags=_loads_list(tags),
+            purpose=purpose,
+            role_ownership=role_ownership,
+            project_phase=project_phase,
+            quality_score=quality_score,
+            complexity_score=complexity_score,
+            maintainability_score=maintainability_score
         )
     
-    def _content_matches_regex(self, file_path: str, regex_pattern: str) -> bool:
-        """파일 콘텐츠가 정규식과 매치되는지 확인"""
+    def _content_matches_regex(self, file_path: str, pattern: re.Pattern) -> bool:
+        """파일 콘텐츠가 정규식과 매치되는지 확인
+        
+        .이나 \\w, 대소문자 무시가 한글 등 비ASCII 문자 단위로 동작하도록 디코딩한 텍스트에 적용
+        """
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return bool(re.search(regex_pattern, content, re.IGNORECASE))
+                return pattern.search(f.read()) is not None
         except Exception:
             return False
     
     def _extract_keywords_from_task(self, task: str) -> List[str]:
         """작업에서 키워드 추출"""
         # 간단한 키워드 추출
-        words = re.findall(r'\b\w+\b', task.lower())
+        words = _WORD_RE.findall(task.lower())
         
         # 불용어 제거
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        keywords = [word for word in words if len(word) > 2 and word not in stop_words]
+        keywords = [word for word in words if len(word) > 2 and word not in _STOP_WORDS]
         
         return keywords[:10]
     
-    def _calculate_file_relevance(self, task: str, file_metadata: FileMetadata) -> float:
-        """파일 관련성 점수 계산"""
+    def _calculate_file_relevance(self, task_keywords: set, file_metadata: FileMetadata) -> float:
+        """파일 관련성 점수 계산 (task_keywords: _extract_keywords_from_task 결과 집합)"""
         score = 0.0
         
-        task_keywords = set(self._extract_keywords_from_task(task))
-        
         # 파일명 매칭
-        file_keywords = set(re.findall(r'\b\w+\b', file_metadata.file_name.lower()))
-        name_overlap = len(task_keywords & file_keywords)
+        name_overlap = len(task_keywords & _lowercase_words(file_metadata.file_name))
         if name_overlap > 0:
             score += 0.4 * (name_overlap / len(task_keywords))
         
         # 태그 매칭
-        tag_overlap = len(task_keywords & set(file_metadata.tags))
+        tag_overlap = len(task_keywords.intersection(file_metadata.tags))
         if tag_overlap > 0:
             score += 0.3 * (tag_overlap / len(task_keywords))
         
         # 목적 매칭
         if file_metadata.purpose:
-            purpose_keywords = set(re.findall(r'\b\w+\b', file_metadata.purpose.lower()))
-            purpose_overlap = len(task_keywords & purpose_keywords)
+            purpose_overlap = len(task_keywords & _lowercase_words(file_metadata.purpose))
             if purpose_overlap > 0:
                 score += 0.2 * (purpose_overlap / len(task_keywords))
         
@@ -1128,35 +1663,87 @@ class SmartFileDiscoverySystem:
         
         return score
     
-    def _update_access_pattern(self, file_path: str):
-        """접근 패턴 업데이트"""
-        with sqlite3.connect(self.metadata_db) as conn:
-            # 최근 30일 접근 횟수 확인
-            thirty_days_ago = (datetime.now() - timedelta(days=30)).isoformat()
-            
-            cursor = conn.execute('''
-                SELECT COUNT(*) FROM access_log 
-                WHERE file_path = ? AND accessed_at >= ?
-            ''', (file_path, thirty_days_ago))
+    def _write_access_log_loop(self):
+        """접근 기록 큐를 최대 access_flush_interval 동안 모아 일괄 저장 (None을 받으면 저장 후 종료)"""
+        running = True
+        while running:
+            record = self._access_queue.get()
+            if record is None:
+                break
+            batch = [record]
+            deadline = time.monotonic() + self.access_flush_interval
             
-            recent_access_count = cursor.fetchone()[0]
+            while len(batch) < self.access_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    record = self._access_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if record is None:
+                    running = False
+                    break
+                batch.append(record)
             
-            # 접근 패턴 결정
-            if recent_access_count >= 20:
-                pattern = AccessPattern.FREQUENT
-            elif recent_access_count >= 5:
-                pattern = AccessPattern.OCCASIONAL
-            elif recent_access_count >= 1:
-                pattern = AccessPattern.RARE
-            else:
-                pattern = AccessPattern.NEVER_ACCESSED
+            try:
+                self._write_access_batch(batch)
+            except Exception as e:
+                print(f"접근 기록 저장 오류: {str(e)}")
+    
+    def _write_access_batch(self, batch: List[tuple]):
+        """접근 기록 일괄 저장 (파일별 접근 횟수는 합산해 한 번만 갱신)"""
+        access_counts: Dict[str, List[Any]] = {}
+        for file_path, _, _, accessed_at in batch:
+            entry = access_counts.setdefault(file_path, [0, accessed_at])
+            entry[0] += 1
+            entry[1] = accessed_at
+        
+        with self._transaction() as conn:
+            conn.executemany('''
+                INSERT INTO access_log (file_path, accessed_by, access_type, accessed_at)
+                VALUES (?, ?, ?, ?)
+            ''', batch)
             
-            # 업데이트
-            conn.execute('''
+            conn.executemany('''
                 UPDATE file_metadata 
-                SET access_pattern = ? 
+                SET access_count = access_count + ?,
+                    last_accessed = ?
                 WHERE file_path = ?
-            ''', (pattern.value, file_path))
+            ''', [(count, last_accessed, file_path)
+                  for file_path, (count, last_accessed) in access_counts.items()])
+            
+            for file_path in access_counts:
+                self._update_access_pattern(conn, file_path)
+    
+    def _update_access_pattern(self, conn: sqlite3.Connection, file_path: str):
+        """접근 패턴 업데이트 (호출자의 트랜잭션 안에서 실행)"""
+        # 최근 30일 접근 횟수 확인
+        thirty_days_ago = (datetime.now() - timedelta(days=30)).isoformat()
+        
+        cursor = conn.execute('''
+            SELECT COUNT(*) FROM access_log 
+            WHERE file_path = ? AND accessed_at >= ?
+        ''', (file_path, thirty_days_ago))
+        
+        recent_access_count = cursor.fetchone()[0]
+        
+        # 접근 패턴 결정
+        if recent_access_count >= 20:
+            pattern = AccessPattern.FREQUENT
+        elif recent_access_count >= 5:
+            pattern = AccessPattern.OCCASIONAL
+        elif recent_access_count >= 1:
+            pattern = AccessPattern.RARE
+        else:
+            pattern = AccessPattern.NEVER_ACCESSED
+        
+        # 업데이트
+        conn.execute('''
+            UPDATE file_metadata 
+            SET access_pattern = ? 
+            WHERE file_path = ?
+        ''', (pattern.value, file_path))
 
 def main():
     """테스트 및 데모"""